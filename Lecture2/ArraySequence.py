@@ -20,6 +20,11 @@
 #   delete_first() - remove and return the first item
 #   insert_last(x) - add x as the last item
 #   delete_last() - remove and return the last item
+# 4. Bulk #
+#   replace_range(i, j, X) - replace the items at indices i to j - 1 with the items in X
+#   insert_many_at(i, X) - add the items in X starting at index i
+#   delete_range(i, j) - remove and return the items at indices i to j - 1
+#   extend(X) - add the items in X after the last item
 
 # -- Implementation -- #
 # Three implementation will be discussed
@@ -73,7 +78,7 @@ class ArraySeq:
         n = len(self)
         A = [None] * (n - 1)
         self._copy_forward(0, i, A, 0)
-        x = A[i]
+        x = self.A[i]
         self._copy_forward(i + 1, n - i - 1, A, i)
         self.build(A)
         return x
@@ -88,4 +93,23 @@ class ArraySeq:
         self.insert_at(len(self), x)
 
     def delete_last(self):                                                                      # O(n)
-        return self.delete_at(len(self) - 1)
\ No newline at end of file
+        return self.delete_at(len(self) - 1)
+
+    # Inserting k items one at a time with insert_at rebuilds the array k times, taking O(kn) time.
+    # Instead, the bulk operations below rebuild the array once, moving whole ranges with slices.
+
+    def replace_range(self, i, j, X):                                                           # O(n + k)
+        X = [x for x in X]
+        self.A = self.A[:i] + X + self.A[j:]
+        self.size = len(self.A)
+
+    def insert_many_at(self, i, X):                                                             # O(n + k)
+        self.replace_range(i, i, X)
+
+    def delete_range(self, i, j):                                                               # O(n)
+        X = list(self.A[i:j])
+        self.replace_range(i, j, [])
+        return X
+
+    def extend(self, X):                                                                        # O(n + k)
+        self.insert_many_at(len(self), X)
@@ -0,0 +1,109 @@
+# Circular Array Sequence #
+# A dynamic array supports insert_last and delete_last in amortized constant time,
+#   but insert_first and delete_first still shift every item in the array, taking O(n) time.
+# To support both ends efficiently, we stop requiring the first item to live at array index 0.
+# Instead, we store the index of the first item, head, and treat the allocation as a ring:
+#   the ith item of the sequence lives at array index (head + i) mod m, where m is the size of the allocation.
+# Then inserting or deleting at the front just moves head one slot backward or forward around the ring,
+#   so a circular array is a natural implementation of a queue or a double ended queue (deque).
+# Resizing uses the same table doubling proportions as the dynamic array (growth factor r, shrink at 1 / r^2),
+#   unrolling the ring so that the first item lands back at index 0 of the new allocation.
+# Inserting or deleting in the middle only has to shift the items on the shorter side of index i.
+# Bulk range operations first unroll the ring so that head is 0, and then reuse the dynamic array versions.
+
+
+from DynamicArray import DynamicArraySeq
+
+
+class CircularArraySeq(DynamicArraySeq):
+    def __init__(self, r = 2, typecode = None):                                     # O(1)
+        self.head = 0
+        super().__init__(r, typecode)
+
+    def __iter__(self):                                                             # O(n)
+        for i in range(self.size):
+            yield self.A[self._index(i)]
+
+    def _index(self, i):                                                            # O(1)
+        return (self.head + i) % len(self.A)
+
+    def get_at(self, i):                                                            # O(1)
+        return self.A[self._index(i)]
+
+    def set_at(self, i, x):                                                         # O(1)
+        self.A[self._index(i)] = x
+
+    def _resize(self, n):                                                           # O(1) or O(n)
+        if self.lower < n < self.upper:
+            return
+        m = max(n, 1) * self.r
+        A = self._allocate(m)
+        k = min(self.size, len(self.A) - self.head)             # items stored before the wraparound
+        A[:k] = self.A[self.head:self.head + k]
+        A[k:self.size] = self.A[:self.size - k]
+        self.A = A
+        self.head = 0
+        self._compute_bounds()
+
+    def insert_last(self, x):                                                       # O(1) amortized
+        self._resize(self.size + 1)
+        self.A[self._index(self.size)] = x
+        self.size += 1
+
+    def delete_last(self):                                                          # O(1) amortized
+        j = self._index(self.size - 1)
+        x = self.A[j]
+        self.A[j] = self.blank
+        self.size -= 1
+        self._resize(self.size)
+        return x
+
+    def insert_first(self, x):                                                      # O(1) amortized
+        self._resize(self.size + 1)
+        self.head = (self.head - 1) % len(self.A)
+        self.A[self.head] = x
+        self.size += 1
+
+    def delete_first(self):                                                         # O(1) amortized
+        x = self.A[self.head]
+        self.A[self.head] = self.blank
+        self.head = (self.head + 1) % len(self.A)
+        self.size -= 1
+        self._resize(self.size)
+        return x
+
+    def insert_at(self, i, x):                                                      # O(min(i, n - i))
+        if i < self.size - i:                   # shift the first i items one slot backward
+            self.insert_first(self.blank)
+            for k in range(i):
+                self.set_at(k, self.get_at(k + 1))
+        else:                                   # shift the last n - i items one slot forward
+            self.insert_last(self.blank)
+            for k in range(self.size - 1, i, -1):
+                self.set_at(k, self.get_at(k - 1))
+        self.set_at(i, x)
+
+    def delete_at(self, i):                                                         # O(min(i, n - i))
+        x = self.get_at(i)
+        if i < self.size - 1 - i:               # close the gap from the front
+            for k in range(i, 0, -1):
+                self.set_at(k, self.get_at(k - 1))
+            self.delete_first()
+        else:                                   # close the gap from the back
+            for k in range(i, self.size - 1):
+                self.set_at(k, self.get_at(k + 1))
+            self.delete_last()
+        return x
+
+    def _unroll(self):                                                              # O(n)
+        if self.head:
+            self.A = self.A[self.head:] + self.A[:self.head]
+            self.head = 0
+
+    def replace_range(self, i, j, X):                                               # O(n + k) amortized
+        self._unroll()
+        super().replace_range(i, j, X)
+
+    def delete_range(self, i, j):                                                   # O(n)
+        self._unroll()
+        return super().delete_range(i, j)
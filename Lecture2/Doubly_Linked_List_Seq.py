@@ -14,6 +14,14 @@ class Doubly_Linked_List_Seq:
     def __init__(self):
         self.head = None
         self.tail = None
+        self.size = 0
+        self.finger = None                      # last node reached by index
+        self.finger_index = None
+
+    def __len__(self):
+        if self.size is None:                   # unknown after remove / splice
+            self.size = sum(1 for _ in self)
+        return self.size
 
     def __iter__(self):
         node = self.head
@@ -28,14 +36,58 @@ class Doubly_Linked_List_Seq:
         for a in X:
             self.insert_last(a)
 
+    # The finger caches the last node found by index, so get_at(i) walks from whichever of
+    #   head, tail or finger is closest to i. A scan by increasing index then takes O(1) per step.
+
+    def _node_at(self, i):
+        node, j = self.head, 0
+        n = len(self)
+        if n - 1 - i < i:
+            node, j = self.tail, n - 1
+        if self.finger and abs(i - self.finger_index) < abs(i - j):
+            node, j = self.finger, self.finger_index
+        while j < i:
+            node, j = node.next, j + 1
+        while j > i:
+            node, j = node.prev, j - 1
+        self.finger, self.finger_index = node, i
+        return node
+
+    def _grow(self, d):
+        if self.size is not None:
+            self.size += d
+
     def get_at(self, i):
-        node = self.head.later_node(i)
+        node = self._node_at(i)
         return node.item
 
     def set_at(self, i, x):
-        node = self.head.later_node(i)
+        node = self._node_at(i)
         node.item = x
 
+    def cursor(self, i = 0):
+        return Doubly_Linked_List_Cursor(self, self._node_at(i) if self.head else None)
+
+    def insert_at(self, i, x):
+        if i == 0:
+            self.insert_first(x)
+        elif i == len(self):
+            self.insert_last(x)
+        else:
+            node = self._insert_before(self._node_at(i), x)
+            self.finger, self.finger_index = node, i
+
+    def delete_at(self, i):
+        if i == 0:
+            return self.delete_first()
+        if i == len(self) - 1:
+            return self.delete_last()
+        node = self._node_at(i)
+        nxt = node.next
+        x = self._delete_node(node)
+        self.finger, self.finger_index = nxt, i   # the next node moves to index i
+        return x
+
     def insert_first(self, x):
         new_node = Doubly_Linked_List_Node(x)
         if self.head is None:
@@ -45,6 +97,9 @@ class Doubly_Linked_List_Seq:
             new_node.next = self.head
             self.head.prev = new_node
             self.head = new_node
+        self._grow(1)
+        if self.finger:
+            self.finger_index += 1
 
     def insert_last(self, x):
         new_node = Doubly_Linked_List_Node(x)
@@ -55,31 +110,85 @@ class Doubly_Linked_List_Seq:
             new_node.prev = self.tail
             self.tail.next = new_node
             self.tail = new_node
+        self._grow(1)
 
     def delete_first(self):
         assert self.head
+        if self.finger is self.head:
+            self.finger = None
+        elif self.finger:
+            self.finger_index -= 1
         x = self.head.item
         self.head = self.head.next
         if self.head is None:
             self.tail = None
         else:
             self.head.prev = None
+        self._grow(-1)
         return x
 
     def delete_last(self):
         assert self.tail
+        if self.finger is self.tail:
+            self.finger = None
         x = self.tail.item
         self.tail = self.tail.prev
         if self.tail is None:
             self.head = None
         else:
             self.tail.next = None
+        self._grow(-1)
         return x
 
+    # Node level operations, used by the cursor and by insert_at / delete_at.
+    # The finger is dropped since the index of the changed node is not known;
+    #   insert_at and delete_at, which do know the index, set it again afterwards.
+
+    def _insert_before(self, node, x):
+        new_node = Doubly_Linked_List_Node(x)
+        new_node.prev, new_node.next = node.prev, node
+        if node.prev:
+            node.prev.next = new_node
+        else:
+            self.head = new_node
+        node.prev = new_node
+        self._grow(1)
+        self.finger = None
+        return new_node
+
+    def _insert_after(self, node, x):
+        new_node = Doubly_Linked_List_Node(x)
+        new_node.prev, new_node.next = node, node.next
+        if node.next:
+            node.next.prev = new_node
+        else:
+            self.tail = new_node
+        node.next = new_node
+        self._grow(1)
+        self.finger = None
+        return new_node
+
+    def _delete_node(self, node):
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = node.next = None
+        self._grow(-1)
+        self.finger = None
+        return node.item
+
     def remove(self, x1, x2):
+        self.size = None
+        self.finger = None
         L2 = Doubly_Linked_List_Seq()
         L2.head = x1
         L2.tail = x2
+        L2.size = None
         if x1 == self.head:
             self.head = x2.next
         else:
@@ -93,11 +202,18 @@ class Doubly_Linked_List_Seq:
         return L2
 
     def splice(self, x, L2):
+        if self.size is not None and L2.size is not None:
+            self.size += L2.size
+        else:
+            self.size = None
+        self.finger = None
         xn = x.next
         x1 = L2.head
         x2 = L2.tail
         L2.head = None
         L2.tail = None
+        L2.size = 0
+        L2.finger = None
         x1.prev = x
         x.next = x1
         x2.next = xn
@@ -105,3 +221,70 @@ class Doubly_Linked_List_Seq:
             xn.prev = x2
         else:
             self.tail = x2
+
+
+# A cursor points at one node of a list, and supports O(1) movement, insertion and removal at that node.
+# Moving off either end leaves the cursor on no node, remembering which end it fell off:
+#   before the head (before_head is True) or past the tail, so insertions there go to the right end,
+#   and moving back returns to the head or tail.
+
+class Doubly_Linked_List_Cursor:
+    def __init__(self, L, node):
+        self.L = L
+        self.node = node
+        self.before_head = False
+
+    def _on_item(self):
+        if self.node is None:
+            raise IndexError("Cursor is not on an item")
+
+    def get(self):
+        self._on_item()
+        return self.node.item
+
+    def set(self, x):
+        self._on_item()
+        self.node.item = x
+
+    def next(self):
+        if self.node is None:
+            if not self.before_head:
+                return False                    # already past the tail
+            self.node, self.before_head = self.L.head, False
+        else:
+            self.node = self.node.next
+        return self.node is not None
+
+    def prev(self):
+        if self.node is None:
+            if self.before_head:
+                return False                    # already before the head
+            self.node = self.L.tail
+        else:
+            self.node = self.node.prev
+            self.before_head = self.node is None
+        return self.node is not None
+
+    def insert_before(self, x):
+        if self.node is None:                   # off either end, or an empty list
+            if self.before_head:
+                self.L.insert_first(x)
+            else:
+                self.L.insert_last(x)
+        else:
+            self.L._insert_before(self.node, x)
+
+    def insert_after(self, x):
+        if self.node is None:                   # off either end, or an empty list
+            if self.before_head:
+                self.L.insert_first(x)
+            else:
+                self.L.insert_last(x)
+        else:
+            self.L._insert_after(self.node, x)
+
+    def delete(self):                           # remove the item at the cursor and move to the next node
+        self._on_item()
+        node = self.node
+        self.node = node.next
+        return self.L._delete_node(node)
@@ -37,15 +37,27 @@
 # Of course Python Lists already support dynamic operations using these techniques;
 #   this code is provided to help you understand how amortized constant append and pop could be implemented.
 
+# ---- Typed Storage ---- #
+# A Python list stores a pointer to a separate boxed object for every item,
+#   so a list of n integers costs a pointer plus a full int object per item.
+# If every item is a machine number, we can pass a typecode (e.g. DynamicArraySeq(typecode = 'q'))
+#   and the sequence is stored in an array.array instead: a contiguous buffer of fixed-width words,
+#   much closer to the static array of the Word-RAM.
+# Empty slots then hold zero instead of None, and copying a range of items is a single bulk buffer move.
 
+
+from array import array
 from ArraySequence import ArraySeq
 
 
 class DynamicArraySeq(ArraySeq):
-    def __init__(self, r = 2):                                                      # O(1)
+    def __init__(self, r = 2, typecode = None):                                     # O(1)
         super().__init__()
         self.size = 0
         self.r = r
+        self.typecode = typecode
+        self.blank = self._allocate(1)[0]                       # value stored in unused slots
+        self.A = self._allocate(0)
         self._compute_bounds()
         self._resize(0)
 
@@ -53,7 +65,7 @@ class DynamicArraySeq(ArraySeq):
         return self.size
 
     def __iter__(self):                                                             # O(n)
-        for i in range(len(self.A)):
+        for i in range(self.size):
             yield self.A[i]
 
     def build(self, X):                                                             # O(n)
@@ -64,11 +76,23 @@ class DynamicArraySeq(ArraySeq):
         self.upper = len(self.A)
         self.lower = len(self.A) // (self.r * self.r)
 
+    def _allocate(self, m):                                                         # O(m)
+        if self.typecode is None:
+            return [None] * m
+        A = array(self.typecode)
+        A.frombytes(bytes(m * A.itemsize))                      # m zeroed words
+        return A
+
+    def _copy_forward(self, i, n, A, j):                                            # O(n)
+        A[j:j + n] = self.A[i:i + n]                            # bulk move, safe when A is self.A
+
+    _copy_backward = _copy_forward                              # the slice copy is safe in either direction
+
     def _resize(self, n):                                                           # O(1) or O(n)
         if self.lower < n < self.upper:
             return
         m = max(n, 1) * self.r
-        A = [None] * m
+        A = self._allocate(m)
         self._copy_forward(0, self.size, A, 0)
         self.A = A
         self._compute_bounds()
@@ -80,13 +104,13 @@ class DynamicArraySeq(ArraySeq):
 
     def delete_last(self):                                                          # O(1) amortized
         x = self.A[self.size - 1]
-        self.A[self.size - 1] = None
+        self.A[self.size - 1] = self.blank
         self.size -= 1
         self._resize(self.size)
         return x
 
     def insert_at(self, i, x):                                                      # O(n)
-        self.insert_last(None)
+        self.insert_last(self.blank)
         self._copy_backward(i, self.size - (i + 1), self.A, i + 1)
         self.A[i] = x
 
@@ -96,6 +120,22 @@ class DynamicArraySeq(ArraySeq):
         self.delete_last()
         return x
 
+    def replace_range(self, i, j, X):                                               # O(n + k) amortized
+        B = self._allocate(0)
+        B.extend(X)
+        k = len(B)
+        n = self.size - (j - i) + k                             # size after replacement
+        tail = self.size - j
+        if k > j - i:                                           # grow first, then shift the tail right
+            self._resize(n)
+            self._copy_backward(j, tail, self.A, i + k)
+        else:                                                   # shift the tail left, then clear the freed slots
+            self._copy_forward(j, tail, self.A, i + k)
+            self.A[n:self.size] = self._allocate(self.size - n)
+        self.A[i:i + k] = B
+        self.size = n
+        self._resize(n)
+
     def insert_first(self, x):                                                      # O(n)
         self.insert_at(0, x)
 
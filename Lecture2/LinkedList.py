@@ -35,7 +35,19 @@
 #          1. node.item storing the item
 #          2. node.next storing the memory address of the node containing the next item in the sequence
 
+# ---- Tail Pointer and Node Pool ---- #
+# Keeping a pointer to the last node as well as the first lets insert_last run in O(1) time.
+# delete_last still needs the node before the tail, and a singly linked node has no pointer back to it,
+#   so it remains O(n).
+# Each node declares __slots__, so it is stored without a per-instance __dict__.
+# When a list is constructed with pool = c > 0, up to c deleted nodes are kept on a free list,
+#   linked through their next pointers, and reused by later insertions instead of allocating new nodes.
+# A deleted node that is not kept is left untouched, so code still holding it (e.g. a concurrent reader)
+#   can read its item and continue through its next pointer.
+
 class LinkedListNode:
+    __slots__ = ('item', 'next')
+
     def __init__(self, x):                                                  # O(1)
         self.item = x
         self.next = None
@@ -48,9 +60,13 @@ class LinkedListNode:
 
 
 class LinkedListSeq:
-    def __init__(self):                                                     # O(1)
+    def __init__(self, pool = 0):                                           # O(1)
         self.head = None
+        self.tail = None
         self.size = 0
+        self.pool = pool                                                    # max number of free nodes kept
+        self.free = None
+        self.free_size = 0
 
     def __len__(self):                                                      # O(1)
         return self.size
@@ -65,6 +81,23 @@ class LinkedListSeq:
         for x in reversed(X):
             self.insert_first(x)
 
+    def _new_node(self, x):                                                 # O(1)
+        if self.free is None:
+            return LinkedListNode(x)
+        node = self.free
+        self.free = node.next
+        self.free_size -= 1
+        node.item = x
+        node.next = None
+        return node
+
+    def _free_node(self, node):                                             # O(1)
+        if self.free_size < self.pool:
+            node.item = None
+            node.next = self.free
+            self.free = node
+            self.free_size += 1
+
     def get_at(self, i):                                                    # O(i)
         node = self.head.later_node(i)
         return node.item
@@ -74,22 +107,31 @@ class LinkedListSeq:
         node.item = x
 
     def insert_first(self, x):                                              # O(1)
-        newNode = LinkedListNode(x)
+        newNode = self._new_node(x)
         newNode.next = self.head
         self.head = newNode
+        if self.tail is None:
+            self.tail = newNode
         self.size += 1
 
     def delete_first(self):                                                 # O(1)
-        x = self.head.item
-        self.head = self.head.next
+        node = self.head
+        x = node.item
+        self.head = node.next
+        if self.head is None:
+            self.tail = None
         self.size -= 1
+        self._free_node(node)
         return x
 
     def insert_at(self, i, x):                                              # O(i)
         if i == 0:
             self.insert_first(x)
             return
-        newNode = LinkedListNode(x)
+        if i == len(self):
+            self.insert_last(x)
+            return
+        newNode = self._new_node(x)
         node = self.head.later_node(i - 1)
         newNode.next = node.next
         node.next = newNode
@@ -99,18 +141,23 @@ class LinkedListSeq:
         if i == 0:
             return self.delete_first()
         node = self.head.later_node(i - 1)
-        x = node.next.item
-        node.next = node.next.next
+        old = node.next
+        x = old.item
+        node.next = old.next
+        if old is self.tail:
+            self.tail = node
         self.size -= 1
+        self._free_node(old)
         return x
 
-    def insert_last(self, x):                                               # O(n)
-        self.insert_at(len(self), x)
+    def insert_last(self, x):                                               # O(1)
+        newNode = self._new_node(x)
+        if self.tail is None:
+            self.head = newNode
+        else:
+            self.tail.next = newNode
+        self.tail = newNode
+        self.size += 1
 
     def delete_last(self):                                                  # O(n)
-        self.delete_at(len(self) - 1)
-
-
-
-
-
+        return self.delete_at(len(self) - 1)
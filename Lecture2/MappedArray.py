@@ -0,0 +1,124 @@
+# Memory Mapped Array Sequence #
+# An array sequence keeps every item in memory, so a sequence larger than memory cannot even be built.
+# If every item is a fixed-width record, e.g. a few machine words described by a struct format like '<qd',
+#   we can instead store the records back to back in a file, where record i starts at byte offset i * record size,
+#   and map the file into memory with mmap.
+# Then get_at(i) and set_at(i, x) just read or write the bytes at a computed offset, in O(1) time like a static array,
+#   while the operating system only loads the pages of the file that are actually touched (lazy paging).
+# Opening an existing file does not read any records, and resident memory is bounded by the OS page cache.
+# Writes go to the page cache and are written back to the file by flush() (or eventually by the OS).
+
+# The file starts with a 40 byte header storing the number of records n and the struct format of the records,
+#   followed by a capacity of records that is at least n.
+# Reopening a file with a different format would silently misread every record, so it raises ValueError instead;
+#   with fmt = None, an existing file is opened with its stored format (and a new file uses '<q').
+# build writes the records one by one as it iterates over X, so X can be a generator larger than memory.
+# Appending past the capacity grows the file and remaps it,
+#   multiplying the capacity by r (with at least chunk records), just like table doubling in a dynamic array.
+
+import mmap
+import os
+import struct
+
+
+class MappedArraySeq:
+    header = struct.Struct('<Q32s')                             # number of records, record format
+
+    def __init__(self, path, fmt = None, r = 2, chunk = 4096):             # O(1)
+        self.r = r
+        self.chunk = chunk                                      # min number of records to grow by
+        exists = os.path.exists(path) and os.path.getsize(path) >= self.header.size
+        self.file = open(path, 'r+b' if exists else 'w+b')
+        if exists:
+            self.M = mmap.mmap(self.file.fileno(), 0)
+            n, stored = self.header.unpack_from(self.M, 0)
+            stored = stored.rstrip(b'\0').decode('ascii')
+            self.M.close()
+            if fmt is None:
+                fmt = stored
+            elif fmt != stored:
+                self.file.close()
+                raise ValueError("File has record format %r, not %r" % (stored, fmt))
+        else:
+            fmt = '<q' if fmt is None else fmt
+            if len(fmt) > 32:
+                self.file.close()
+                raise ValueError("Record format longer than 32 characters")
+            n = 0
+            self.file.truncate(self.header.size)
+        self.fmt = fmt
+        self.record = struct.Struct(fmt)
+        self.M = None
+        self._map()
+        self._set_size(n)
+
+    def __len__(self):                                                      # O(1)
+        return self.size
+
+    def __iter__(self):                                                     # O(n)
+        for i in range(self.size):
+            yield self.get_at(i)
+
+    def _map(self):                                                         # O(1)
+        if self.M is not None:
+            self.M.close()
+        self.M = mmap.mmap(self.file.fileno(), 0)
+        self.capacity = (len(self.M) - self.header.size) // self.record.size
+
+    def _offset(self, i):                                                   # O(1)
+        if not (0 <= i < self.size):
+            raise IndexError
+        return self.header.size + i * self.record.size
+
+    def _put(self, i, x):                                                   # O(1), any i < capacity
+        if not isinstance(x, tuple):
+            x = (x,)
+        self.record.pack_into(self.M, self.header.size + i * self.record.size, *x)
+
+    def _reserve(self, n):                                                  # O(1) or O(n)
+        if n <= self.capacity:
+            return
+        m = max(n, self.capacity * self.r, self.chunk)
+        self.M.flush()
+        self.file.truncate(self.header.size + m * self.record.size)
+        self._map()
+
+    def _set_size(self, n):                                                 # O(1)
+        self.size = n
+        self.header.pack_into(self.M, 0, n, self.fmt.encode('ascii'))
+
+    def build(self, X):                                                     # O(n)
+        if hasattr(X, '__len__'):
+            self._reserve(len(X))
+        n = 0
+        for x in X:                                             # stream, without copying X into memory
+            self._reserve(n + 1)
+            self._put(n, x)
+            n += 1
+        self._set_size(n)
+
+    def get_at(self, i):                                                    # O(1)
+        x = self.record.unpack_from(self.M, self._offset(i))
+        return x[0] if len(x) == 1 else x
+
+    def set_at(self, i, x):                                                 # O(1)
+        self._offset(i)
+        self._put(i, x)
+
+    def insert_last(self, x):                                               # O(1) amortized
+        self._reserve(self.size + 1)
+        self._set_size(self.size + 1)
+        self.set_at(self.size - 1, x)
+
+    def delete_last(self):                                                  # O(1)
+        x = self.get_at(self.size - 1)
+        self._set_size(self.size - 1)
+        return x
+
+    def flush(self):                                                        # O(dirty pages)
+        self.M.flush()
+
+    def close(self):                                                        # O(dirty pages)
+        self.M.flush()
+        self.M.close()
+        self.file.close()
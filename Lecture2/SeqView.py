@@ -0,0 +1,49 @@
+# Sequence View #
+# Slicing a Python list, e.g. A[a:b], copies the b - a items into a new list, taking O(b - a) time and space.
+# When an algorithm only needs to read or write a range of an existing sequence,
+#   we can instead store a reference to the sequence together with the range of indices it covers.
+# A view over seq with (start, stop, step) maps its ith item to item start + i * step of seq,
+#   exactly like a Python range object, so we keep a range and let it handle negative and missing bounds.
+# Building a view takes O(1) time, and slicing a view returns another view over the same underlying sequence,
+#   so nested slices never copy.
+# A view works over a Python list or any sequence supporting get_at and set_at (ArraySeq, DynamicArraySeq, ...),
+#   and supports both the sequence interface (get_at, set_at) and Python indexing (A[i], A[i] = x, A[a:b]),
+#   so algorithms written for Python lists, like merge sort, can run directly on a range of a sequence.
+
+
+class SeqView:
+    def __init__(self, seq, start = None, stop = None, step = None):            # O(1)
+        if isinstance(seq, SeqView):                            # compose with the existing view
+            self.seq = seq.seq
+            self.R = seq.R[start:stop:step]
+        else:
+            self.seq = seq
+            self.R = range(len(seq))[start:stop:step]
+        if hasattr(self.seq, 'get_at'):
+            self._get, self._set = self.seq.get_at, self.seq.set_at
+        else:
+            self._get, self._set = self.seq.__getitem__, self.seq.__setitem__
+
+    def __len__(self):                                                          # O(1)
+        return len(self.R)
+
+    def __iter__(self):                                                         # O(n)
+        for i in self.R:
+            yield self._get(i)
+
+    def get_at(self, i):                                                        # O(1)
+        return self._get(self.R[i])
+
+    def set_at(self, i, x):                                                     # O(1)
+        self._set(self.R[i], x)
+
+    def view(self, start = None, stop = None, step = None):                     # O(1)
+        return SeqView(self, start, stop, step)
+
+    def __getitem__(self, i):                                                   # O(1)
+        if isinstance(i, slice):
+            return SeqView(self, i.start, i.stop, i.step)
+        return self._get(self.R[i])
+
+    def __setitem__(self, i, x):                                                # O(1)
+        self._set(self.R[i], x)
@@ -22,8 +22,49 @@
 # --------- Implementation from Sequence Data Structure ----------- #
 # Does not necessary has good performance
 
+class OrderFromIteration:
+    # Order operations of a set that can only iterate over its items, shared by the sets below;
+    #   each looks at every item, taking O(n) time, and iter_ord takes O(n^2) time.
+
+    def find_min(self):
+        out = None
+        for x in self:
+            if (out is None) or (x.key < out.key):
+                out = x
+        return out
+
+    def find_max(self):
+        out = None
+        for x in self:
+            if (out is None) or (x.key > out.key):
+                out = x
+        return out
+
+    def find_next(self, k):
+        out = None
+        for x in self:
+            if x.key > k:
+                if (out is None) or (x.key < out.key):
+                    out = x
+        return out
+
+    def find_prev(self, k):
+        out = None
+        for x in self:
+            if x.key < k:
+                if (out is None) or (x.key > out.key):
+                    out = x
+        return out
+
+    def iter_ord(self):
+        x = self.find_min()
+        while x:
+            yield x
+            x = self.find_next(x.key)
+
+
 def setFromSequence(Sequence):
-    class SetFromSequence:
+    class SetFromSequence(OrderFromIteration):
         def __init__(self):
             self.S = Sequence()
 
@@ -40,8 +81,9 @@ def setFromSequence(Sequence):
             for i in range(len(self.S)):
                 if self.S.get_at(i).key == x.key:
                     self.S.set_at(i, x)
-                    return
+                    return False
             self.S.insert_last(x)
+            return True
 
         def delete(self, k):
             for i in range(len(self.S)):
@@ -54,44 +96,78 @@ def setFromSequence(Sequence):
                     return x
             return None
 
-        def find_min(self):
-            out = None
-            for x in self.S:
-                if (out is None) or (x.key < out.key):
-                    out = x
-            return out
+    return SetFromSequence
 
-        def find_max(self):
-            out = None
-            for x in self.S:
-                if (out is None) or (x.key > out.key):
-                    out = x
-            return out
 
-        def find_next(self, k):
-            out = None
-            for x in self.S:
-                if x.key > k:
-                    if (out is None) or (x.key < out.key):
-                        out = x
-            return out
 
-        def find_prev(self, k):
-            out = None
-            for x in self.S:
-                if x.key < k:
-                    if (out is None) or (x.key > out.key):
-                        out = x
-            return out
 
-        def iter_ord(self):
-            x = self.find_min()
-            while x:
-                yield x
-                x = self.find_next(x.key)
+# --------- Indexed Implementation from Sequence Data Structure ----------- #
+# The implementation above finds a key by scanning the whole sequence,
+#   so find, insert, and delete take O(n) time (and delete on a linked list even O(n^2), since each get_at(i) walks i nodes).
+# Instead, we can keep a hash map (a Python dict) from each key to the place of its item in the sequence.
+# Positions in a sequence shift when an item before them is removed, so the map does not store positions:
+#   the sequence stores a small cell [x] for each item, and the map stores a reference to the cell of each key.
+# Then find, replacing an item, and delete only touch the cell, in expected O(1) time,
+#   and insert appends a new cell at the end of the sequence, so iteration keeps the order in which keys were first inserted.
+# Delete empties the cell instead of removing it from the sequence;
+#   once there are more empty cells than items, the sequence is rebuilt from the non-empty cells in O(n) time,
+#   so delete takes expected O(1) amortized time, and insert takes expected O(1) time plus the time of insert_last.
 
-    return SetFromSequence
+def indexedSetFromSequence(Sequence):
+    class IndexedSetFromSequence(OrderFromIteration):
+        def __init__(self):
+            self.S = Sequence()
+            self.index = {}                             # key -> cell [x] stored in self.S
+            self.empty = 0                              # cells of deleted items still in self.S
 
+        def __len__(self):
+            return len(self.index)
 
+        def __iter__(self):
+            for cell in self.S:
+                if cell[0] is not None:
+                    yield cell[0]
 
+        def build(self, A):
+            self.index = {}
+            cells = []
+            for x in A:
+                if x.key in self.index:
+                    self.index[x.key][0] = x
+                else:
+                    self.index[x.key] = [x]
+                    cells.append(self.index[x.key])
+            self.S = Sequence()
+            self.S.build(cells)
+            self.empty = 0
+
+        def insert(self, x):
+            cell = self.index.get(x.key)
+            if cell is not None:
+                cell[0] = x
+                return False
+            cell = [x]
+            self.index[x.key] = cell
+            self.S.insert_last(cell)
+            return True
+
+        def delete(self, k):
+            cell = self.index.pop(k, None)
+            if cell is None:
+                return None
+            x, cell[0] = cell[0], None
+            self.empty += 1
+            if self.empty > len(self.index):
+                cells = [c for c in self.S if c[0] is not None]
+                self.S = Sequence()
+                self.S.build(cells)
+                self.empty = 0
+            return x
+
+        def find(self, k):
+            cell = self.index.get(k)
+            if cell is None:
+                return None
+            return cell[0]
 
+    return IndexedSetFromSequence
@@ -0,0 +1,131 @@
+# Shared Memory Array Sequence #
+# A typed array sequence (see DynamicArraySeq(typecode = ...)) stores its items in one contiguous buffer of words.
+# If that buffer lives in a named block of shared memory (multiprocessing.shared_memory),
+#   other processes can attach to the block by name and read the items in place, without making their own copy,
+#   so memory use stays the same no matter how many reader processes attach.
+# A shared memory block cannot grow, so the sequence is created with a fixed capacity,
+#   and insert_last past the capacity raises an error.
+
+# ---- Seqlock ---- #
+# We allow a single writer process and any number of readers.
+# The block starts with a header of four words: version, size, capacity, and the typecode of the items.
+# Before changing anything, the writer increments version to an odd number, and increments it again when done,
+#   so version is odd exactly while a write is in progress.
+# A reader reads version, then the data, then version again,
+#   and retries if the version was odd or changed in between, since it may have seen a partial write.
+# Readers never block the writer, and a read only retries if it overlaps a write.
+
+import os
+import sys
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+
+
+_created = set()                                                            # names of blocks created by this process
+
+
+class SharedArraySeq:
+    def __init__(self, name = None, typecode = 'q', capacity = None):       # O(1) or O(capacity)
+        # with a capacity, create a new block (named name, or a fresh name if None); otherwise attach to name
+        create = capacity is not None
+        if create:
+            size = 32 + max(capacity, 1) * array(typecode).itemsize
+            self.shm = shared_memory.SharedMemory(name, create = True, size = size)
+            _created.add(self.shm.name)
+        elif sys.version_info >= (3, 13):
+            self.shm = shared_memory.SharedMemory(name, track = False)
+        else:
+            self.shm = shared_memory.SharedMemory(name)
+            # Attaching also registers the block with this process's resource tracker,
+            #   which unlinks the block when this process exits, destroying it for every other process.
+            # Only the creating process should own the block, so other processes undo the registration.
+            if (os.name == 'posix') and (self.shm.name not in _created):
+                resource_tracker.unregister(self.shm._name, 'shared_memory')
+        self.header = self.shm.buf[:32].cast('Q')
+        if create:
+            self.header[0], self.header[1], self.header[2], self.header[3] = 0, 0, capacity, ord(typecode)
+        self.name = self.shm.name
+        self.capacity = self.header[2]
+        self.typecode = chr(self.header[3])
+        self.A = self.shm.buf[32:32 + self.capacity * array(self.typecode).itemsize].cast(self.typecode)
+
+    def __len__(self):                                                      # O(1)
+        return self.header[1]
+
+    def __iter__(self):                                                     # O(n)
+        yield from self.snapshot()
+
+    # ---- Readers ---- #
+
+    def _read(self, f):                                                     # O(T(f)) expected
+        while True:
+            v = self.header[0]
+            if v % 2:
+                continue
+            x = f()
+            if self.header[0] == v:
+                return x
+
+    def get_at(self, i):                                                    # O(1)
+        def read():
+            if not (0 <= i < self.header[1]):
+                raise IndexError
+            return self.A[i]
+        return self._read(read)
+
+    def snapshot(self):                                                     # O(n)
+        return self._read(lambda: self.A[:self.header[1]].tolist())
+
+    # ---- Writer ---- #
+
+    def _begin_write(self):                                                 # O(1)
+        self.header[0] += 1
+
+    def _end_write(self):                                                   # O(1)
+        self.header[0] += 1
+
+    def build(self, X):                                                     # O(n)
+        X = array(self.typecode, X)
+        if len(X) > self.capacity:
+            raise IndexError("Build past shared array capacity")
+        self._begin_write()
+        self.A[:len(X)] = X                                     # bulk copy into the shared buffer
+        self.header[1] = len(X)
+        self._end_write()
+
+    def set_at(self, i, x):                                                 # O(1)
+        if not (0 <= i < self.header[1]):
+            raise IndexError
+        self._begin_write()
+        self.A[i] = x
+        self._end_write()
+
+    def insert_last(self, x):                                               # O(1)
+        n = self.header[1]
+        if n >= self.capacity:
+            raise IndexError("Insert into full shared array")
+        self._begin_write()
+        self.A[n] = x
+        self.header[1] = n + 1
+        self._end_write()
+
+    def delete_last(self):                                                  # O(1)
+        n = self.header[1]
+        if n < 1:
+            raise IndexError("Delete from empty shared array")
+        self._begin_write()
+        x = self.A[n - 1]
+        self.header[1] = n - 1
+        self._end_write()
+        return x
+
+    # ---- Cleanup ---- #
+    # Every process calls close() when done; the creating process also calls unlink() to free the block.
+
+    def close(self):                                                        # O(1)
+        self.A.release()
+        self.header.release()
+        self.shm.close()
+
+    def unlink(self):                                                       # O(1)
+        self.shm.unlink()
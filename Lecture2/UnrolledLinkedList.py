@@ -0,0 +1,155 @@
+# Unrolled Linked List Sequence #
+
+# A linked list pays for one node per item, and finding the ith item means following i next pointers.
+# An unrolled linked list instead stores a small array of up to b items in each node,
+#   so the number of nodes, and the number of pointers followed by get_at(i), drops by a factor of about b.
+# Each node stays between half full and full:
+#   • when an insertion overflows a node past b items, the node is split into two half full nodes;
+#   • when a deletion drops a node below b / 2 items, it borrows items from its next node,
+#     or merges with its next node if the two together fit in one node.
+# Then any node other than the last holds at least b / 2 items, so there are at most 2n / b + 1 nodes.
+# Finding the node holding index i takes O(n / b) time, and shifting items within that node takes O(b) time,
+#   so choosing b close to √n gives O(√n) time indexed operations,
+#   with items stored next to each other in memory rather than scattered across n separate nodes.
+
+# ---- Re-blocking ---- #
+# A fixed b only gives O(√n) time for n close to b^2, so by default (b = None) the list keeps b close to √n itself:
+#   whenever n grows to 4 times, or shrinks to a quarter of, the size n0 at which b was last chosen,
+#   all items are moved into new full nodes with b = √n, taking O(n) time.
+# Θ(n) operations happen between two re-blockings, so this adds O(1) amortized time per operation,
+#   and b always stays within a factor of 2 of √n (and at least 8).
+# Passing a number b keeps that node size fixed instead.
+
+from math import isqrt
+
+
+class UnrolledNode:
+    __slots__ = ('items', 'next')
+
+    def __init__(self, items):                                              # O(1)
+        self.items = items
+        self.next = None
+
+
+class UnrolledLinkedListSeq:
+    def __init__(self, b = None):                                           # O(1)
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.adaptive = b is None                                           # keep b close to √n
+        self.b = 8 if b is None else max(b, 2)                              # max number of items per node
+        self.low, self.high = 0, 64                                         # re-block outside [low, high]
+
+    def __len__(self):                                                      # O(1)
+        return self.size
+
+    def __iter__(self):                                                     # O(n)
+        node = self.head
+        while node:
+            yield from node.items
+            node = node.next
+
+    def build(self, X):                                                     # O(n)
+        for x in X:
+            self._append(x)
+        self._check()
+
+    def _check(self):                                                       # O(1) amortized
+        if self.adaptive and not (self.low <= self.size <= self.high):
+            self._reblock()
+
+    def _reblock(self):                                                     # O(n)
+        X = list(self)
+        self.head = self.tail = None
+        self.size = 0
+        self.b = max(8, isqrt(len(X)))
+        self.low, self.high = len(X) // 4, max(4 * len(X), 64)
+        for x in X:
+            self._append(x)
+
+    def _node_at(self, i):                                                  # O(n / b)
+        # return (prev, node, j) where the ith item is node.items[j]
+        prev, node = None, self.head
+        while i >= len(node.items):
+            i -= len(node.items)
+            prev, node = node, node.next
+        return prev, node, i
+
+    def get_at(self, i):                                                    # O(n / b)
+        _, node, j = self._node_at(i)
+        return node.items[j]
+
+    def set_at(self, i, x):                                                 # O(n / b)
+        _, node, j = self._node_at(i)
+        node.items[j] = x
+
+    def _split(self, node):                                                 # O(b)
+        c = len(node.items) // 2
+        newNode = UnrolledNode(node.items[c:])
+        del node.items[c:]
+        newNode.next = node.next
+        node.next = newNode
+        if node is self.tail:
+            self.tail = newNode
+
+    def _fix_underflow(self, prev, node):                                   # O(b)
+        nxt = node.next
+        if nxt and len(node.items) < self.b // 2:
+            if len(node.items) + len(nxt.items) <= self.b:      # merge with next node
+                node.items.extend(nxt.items)
+                node.next = nxt.next
+                if nxt is self.tail:
+                    self.tail = node
+            else:                                               # borrow from next node
+                c = (len(nxt.items) - len(node.items)) // 2
+                node.items.extend(nxt.items[:c])
+                del nxt.items[:c]
+        if not node.items:                                      # only the last node can become empty
+            if prev:
+                prev.next = node.next
+            else:
+                self.head = node.next
+            if node is self.tail:
+                self.tail = prev
+
+    def insert_at(self, i, x):                                              # O(n / b + b)
+        if i == self.size:
+            self.insert_last(x)
+            return
+        _, node, j = self._node_at(i)
+        node.items.insert(j, x)
+        self.size += 1
+        if len(node.items) > self.b:
+            self._split(node)
+        self._check()
+
+    def delete_at(self, i):                                                 # O(n / b + b)
+        prev, node, j = self._node_at(i)
+        x = node.items.pop(j)
+        self.size -= 1
+        self._fix_underflow(prev, node)
+        self._check()
+        return x
+
+    def insert_first(self, x):                                              # O(b)
+        self.insert_at(0, x)
+
+    def delete_first(self):                                                 # O(b)
+        return self.delete_at(0)
+
+    def insert_last(self, x):                                               # O(1) amortized
+        self._append(x)
+        self._check()
+
+    def _append(self, x):                                                   # O(1)
+        if self.tail is None:
+            self.head = self.tail = UnrolledNode([])
+        elif len(self.tail.items) >= self.b:
+            newNode = UnrolledNode([])
+            self.tail.next = newNode
+            self.tail = newNode
+        self.tail.items.append(x)
+        self.size += 1
+
+    def delete_last(self):                                                  # O(n / b)
+        return self.delete_at(self.size - 1)
@@ -1,5 +1,11 @@
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
 from Doubly_Linked_List_Seq  import Doubly_Linked_List_Seq
+from MappedArray import MappedArraySeq
+from SharedArray import SharedArraySeq
 
 # Change to True to visualize output
 verbose = False
@@ -81,6 +87,83 @@ class TestCases(unittest.TestCase):
     def test_03(self): self.assertTrue(check(tests[ 2]))
     def test_04(self): self.assertTrue(check(tests[ 3]))
     def test_05(self): self.assertTrue(check(tests[ 4]))
+    def test_shared_attach(self): self.assertTrue(check_shared_attach())
+    def test_mapped_format(self): self.assertTrue(check_mapped_format())
+    def test_finger(self): self.assertTrue(check_finger())
+    def test_cursor(self): self.assertTrue(check_cursor())
+
+
+def check_shared_attach():
+    # a separate reader process attaches by name, reads, and exits; the block must survive it
+    A = SharedArraySeq(typecode = 'q', capacity = 8)
+    try:
+        A.build([3, 1, 4])
+        reader = 'from SharedArray import SharedArraySeq\n' \
+                 'B = SharedArraySeq(%r)\n' \
+                 'print(B.snapshot())\n' \
+                 'B.close()\n' % A.name
+        out = subprocess.run([sys.executable, '-c', reader], capture_output = True, text = True,
+                             cwd = os.path.dirname(os.path.abspath(__file__)))
+        if out.stdout.strip() != '[3, 1, 4]':
+            return False
+        B = SharedArraySeq(A.name)                              # still attachable after the reader exited
+        ok = B.snapshot() == [3, 1, 4]
+        B.close()
+        return ok
+    finally:
+        A.close()
+        A.unlink()
+
+
+
+def check_mapped_format():
+    # build streams from a generator, and reopening with another record format is an error
+    path = os.path.join(tempfile.mkdtemp(), 'records.bin')
+    A = MappedArraySeq(path, '<qd')
+    A.build((i, i / 2) for i in range(5000))
+    A.close()
+    try:
+        MappedArraySeq(path, '<q')
+        return False
+    except ValueError:
+        pass
+    B = MappedArraySeq(path)
+    ok = (B.fmt == '<qd') and (len(B) == 5000) and (B.get_at(4999) == (4999, 2499.5))
+    B.close()
+    os.remove(path)
+    return ok
+
+
+
+def check_finger():
+    # deleting from the middle by index keeps the finger on the node that moved into its place
+    L = Doubly_Linked_List_Seq()
+    L.build(range(10))
+    out = [L.delete_at(3) for _ in range(5)]
+    return (out == [3, 4, 5, 6, 7]) and (L.finger_index == 3) and (L.finger.item == 8) \
+        and (list(L) == [0, 1, 2, 8, 9]) and (L.get_at(4) == 9)
+
+
+def check_cursor():
+    # a cursor off either end inserts at that end, and cannot get or delete
+    L = Doubly_Linked_List_Seq()
+    c = L.cursor(0)
+    c.insert_after(1)
+    c = L.cursor(0)
+    c.next()
+    c.insert_after(2)
+    c.insert_before(3)
+    c = L.cursor(0)
+    c.prev()
+    c.insert_after(0)
+    try:
+        c.delete()
+        return False
+    except IndexError:
+        pass
+    c.next()
+    x = c.delete()
+    return (x == 0) and (c.get() == 1) and (list(L) == [1, 2, 3])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,20 @@
+# ------------------------- Binary Search -------------------------- #
+# Given a sorted array A of items, binary search finds the position of a key k
+#   by comparing k with the middle item of the remaining range and discarding the half that cannot contain k.
+# Each comparison halves the range, so the search takes O(log n) time.
+# The function below returns the smallest index i in [a, b) such that A[i].key >= k, or b if no such index exists,
+#   so k is stored in A exactly when i < b and A[i].key == k.
+# It is written as a loop rather than recursively, and only indexes A with single positions,
+#   so A can be a Python list or a SeqView (Lecture2/SeqView.py) over a range of a sorted sequence, without copying.
+# With packed = True, A holds the keys themselves rather than items, e.g. the packed key list of SortedArraySet.
+
+def binarySearch(A, k, a = 0, b = None, packed = False):            # Search sub-array A[a:b] for key k
+    if b is None:                                                   # O(1) Check if b is provided in the argument
+        b = len(A)                                                  # O(1) Set b to len(A)
+    while a < b:                                                    # O(log n) Halve the range each iteration
+        c = (a + b) // 2                                            # O(1) Calculate mid point of a:b
+        if (A[c] if packed else A[c].key) < k:                      # O(1) Compare middle item
+            a = c + 1                                               # O(1) k is in the right half A[c+1:b]
+        else:
+            b = c                                                   # O(1) k is in the left half A[a:c]
+    return a
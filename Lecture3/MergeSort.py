@@ -30,3 +30,36 @@ def mergeSort(A, a = 0, b = None):                                  # Sort sub-a
 # The above implementation is not stable, but it can be made stable with only a small modification.
 # Can you modify the implementation to make it stable?
 
+
+# -------------- Merge Sort with One Buffer -------------- #
+# The implementation above allocates new lists L and R at every level of the recursion.
+# Instead, we can allocate a single temporary array T the size of A once,
+#   and at each merge copy A[a:b] into the same positions of T before merging back into A.
+# The copying is still Θ(n) per level, but no new lists are allocated during the recursion.
+# This version only indexes A with single positions, so A can be a Python list
+#   or a SeqView (Lecture2/SeqView.py) over a range of a list or array sequence, sorting that range without copying it.
+# Taking from the left half on ties (<=) makes this version stable.
+# Given a function key, items are compared by key(x) instead of by themselves, e.g. key = lambda x: x.key.
+
+def mergeSortView(A, a = 0, b = None, T = None, key = None):        # Sort sub-array A[a:b]
+    if b is None:                                                   # O(1) Check if b is provided in the argument
+        b = len(A)                                                  # O(1) Set b to len(A)
+    if T is None:                                                   # O(1) Check if a buffer is provided
+        T = [None] * len(A)                                         # O(n) Allocate the buffer once
+    if key is None:                                                 # O(1) Compare items themselves
+        key = lambda x: x
+    if 1 < b - a:                                                   # O(1) Check the size of b - a
+        c = (a + b + 1) // 2                                        # O(1) Calculate mid point of a:b
+        mergeSortView(A, a, c, T, key)                              # T(k/2) Recursively sort left A[a:c]
+        mergeSortView(A, c, b, T, key)                              # T(k/2) Recursively sort right A[c:b]
+        for k in range(a, b):                                       # O(k) Copy into the buffer
+            T[k] = A[k]
+        i, j = a, c                                                 # O(1) Initialize pointers i, j
+        while a < b:                                                # O(k)
+            if (j >= b) or (i < c and key(T[i]) <= key(T[j])):      # O(1) Check side
+                A[a] = T[i]                                         # O(1) Merge from left
+                i = i + 1                                           # O(1) Increment i
+            else:
+                A[a] = T[j]                                         # O(1) Merge from right
+                j = j + 1                                           # O(1) Increment j
+            a = a + 1                                               # O(1) Increment a
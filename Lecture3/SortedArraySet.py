@@ -29,12 +29,72 @@
 # items still need to be shifted when inserting or removing from the middle of the array
 # But finding items by their key is much faster! But how do we get a sorted array in the first place?
 
+# ---- Building by Sorting ---- #
+# build sorts the items by key with a sorting engine, a function that sorts a list of items by key in place, stably.
+# The default engine, sortByKey, uses radix sort (Lecture5) when every key is a non-negative integer,
+#   taking O(n + n log u / log n) time, and merge sort (Lecture3) otherwise, taking O(n log n) time;
+#   another engine can be passed to the constructor, e.g. SortedArraySet(mergeSortByKey).
+# If several items have the same key, the last one is kept, as if they were inserted one by one.
+# Inserting k items one at a time shifts the array k times, taking O(kn) time.
+# Instead, insert_many sorts the k new items and merges them with the stored items in one pass,
+#   taking O(n + k log k) time.
+
+# ---- Searching ---- #
+# Every search is one iterative lower bound search, _lower_bound(k), using binarySearch (BinarySearch.py),
+#   returning the index of the first item with key at least k (or n if there is none);
+#   find, find_next, find_prev, insert, and delete all look at that index or its neighbour.
+# The keys are also kept in a separate packed list K, parallel to the array,
+#   so each step of the search is one list lookup rather than a get_at call followed by reading .key.
+# A binary search on a large array jumps between far apart positions, each likely a cache miss.
+# With layout = 'eytzinger', the keys are also stored in the order of a breadth first walk of the implicit search tree
+#   (the root, i.e. the middle key, at index 1, and the children of index i at 2i and 2i + 1).
+# Then the first few steps of every search read keys that are next to each other in memory,
+#   and each step just moves to 2i or 2i + 1 without tracking a range.
+# The Eytzinger copy is built lazily by the first search after build, insert_many, insert, or delete changed the keys,
+#   in O(n) time, which the change already paid for, so it suits sets with many more finds than changes.
+
+# ---- Range Operations ---- #
+# The items with keys in a range [lo, hi) are stored next to each other in the array, from index _lower_bound(lo)
+#   up to (not including) index _lower_bound(hi), so two searches find all of them:
+#   range_iter(lo, hi) - return the stored items with keys in [lo, hi) one-by-one in key order   O(log n + output)
+#   range_count(lo, hi) - return the number of stored items with keys in [lo, hi)                O(log n)
+#   range_delete(lo, hi) - remove and return the stored items with keys in [lo, hi)              O(n), one shift
+#   rank(k) - return the number of stored items with keys smaller than k                          O(log n)
+#   select(i) - return the stored item with the i-th smallest key, counting from 0                O(1)
+
+# ---- Batch Searches ---- #
+# find_many, find_next_many, and find_prev_many answer a whole list of k queries, returning a list of k answers.
+# All three first compute the lower bound index of every query key in one step (_lower_bounds):
+#   if k log n < n + k, by one search per query;
+#   otherwise by sorting the queries (unless they are already sorted)
+#   and walking through the keys and the sorted queries together once, like the merge step of merge sort,
+#   so a large batch costs O(n + k log k) (or O(n + k) if sorted), instead of O(k log n).
+
 from Lecture2.ArraySequence import ArraySeq
+from Lecture3.BinarySearch import binarySearch
+from Lecture3.MergeSort import mergeSortView
+from Lecture5.RadixSort import radixSort
+
+
+def mergeSortByKey(A):                                              # O(n log n)
+    mergeSortView(A, key = lambda x: x.key)
+
+
+def sortByKey(A):                                                   # O(n log n) or O(n + n log u / log n)
+    if A and all(isinstance(x.key, int) and x.key >= 0 for x in A):
+        radixSort(A)
+    else:
+        mergeSortByKey(A)
 
 
 class SortedArraySet:
-    def __init__(self):                                             # O(1)
+    def __init__(self, sort = sortByKey, layout = None):            # O(1)
         self.A = ArraySeq()
+        self.K = []                                                 # keys of self.A
+        self.sort = sort                                            # sorting engine
+        self.layout = layout                                        # None or 'eytzinger'
+        self.E = None                                               # Eytzinger keys, when built
+        self.P = None                                               # P[i] = index in self.A of key E[i]
 
     def __len__(self):                                              # O(1)
         return len(self.A)
@@ -45,14 +105,50 @@ class SortedArraySet:
     def iter_order(self):                                           # O(n)
         yield from self
 
-    def build(self, X):                                             # O(?)
+    def build(self, X):                                             # O(n log n)
         self.A.build(X)
         self._sort()
 
-    def _sort(self):                                                # O(?)
-        # ??
-        # To be discussed later
-        pass
+    def _sort(self):                                                # O(n log n)
+        X = list(self.A)
+        self.sort(X)
+        self._set_items(self._unique(X))
+
+    def _set_items(self, X):                                        # O(n)
+        self.A.build(X)
+        self.K = [x.key for x in X]
+        self.E = self.P = None
+
+    def _unique(self, X):                                           # O(n)
+        # keep the last of each run of items with equal keys in sorted X
+        out = []
+        for x in X:
+            if out and (out[-1].key == x.key):
+                out[-1] = x
+            else:
+                out.append(x)
+        return out
+
+    def insert_many(self, X):                                       # O(n + k log k)
+        B = [x for x in X]
+        self.sort(B)
+        B = self._unique(B)
+        A = list(self.A)
+        out = []
+        i, j, count = 0, 0, 0
+        while (i < len(A)) or (j < len(B)):
+            if (j >= len(B)) or ((i < len(A)) and (A[i].key < B[j].key)):
+                out.append(A[i])
+                i += 1
+            else:
+                if (i < len(A)) and (A[i].key == B[j].key):         # replace stored item
+                    i += 1
+                else:
+                    count += 1
+                out.append(B[j])
+                j += 1
+        self._set_items(out)
+        return count
 
     def find_min(self):                                             # O(1)
         if len(self) > 0:
@@ -66,70 +162,128 @@ class SortedArraySet:
         else:
             return None
 
-    def _binary_search(self, k, i, j):                              # O(log n)
-        if i >= j:
-            return i
-        m = (i + j) // 2
-        x = self.A.get_at(m)
-        if x.key > k:
-            return self._binary_search(k, i, m - 1)
-        if x.key < k:
-            return self._binary_search(k, m + 1, j)
-        return m
+    def _build_eytzinger(self):                                     # O(n)
+        n = len(self.K)
+        self.E, self.P = [None] * (n + 1), [None] * (n + 1)
+        i, k, stack = 0, 1, []
+        while stack or (k <= n):                                    # in-order walk of the implicit tree
+            if k <= n:
+                stack.append(k)
+                k = 2 * k
+            else:
+                k = stack.pop()
+                self.E[k], self.P[k] = self.K[i], i
+                i += 1
+                k = 2 * k + 1
+
+    def _lower_bound(self, k):                                      # O(log n)
+        K, n = self.K, len(self.K)
+        if self.layout == 'eytzinger':
+            if self.E is None:
+                self._build_eytzinger()
+            E, i = self.E, 1
+            while i <= n:
+                i = 2 * i + (E[i] < k)
+            i >>= (~i & (i + 1)).bit_length()                       # undo the right turns after the last left turn
+            return self.P[i] if i else n
+        return binarySearch(K, k, 0, n, packed = True)
 
     def find(self, k):                                              # O(log n)
-        if len(self) == 0:
-            return None
-        i = self._binary_search(k, 0, len(self) - 1)
-        x = self.A.get_at(i)
-        if x.key == k:
-            return x
-        else:
-            return None
+        i = self._lower_bound(k)
+        if (i < len(self.K)) and (self.K[i] == k):
+            return self.A.get_at(i)
+        return None
 
     def find_next(self, k):                                         # O(log n)
-        if len(self) == 0:
-            return None
-        i = self._binary_search(k, 0, len(self) - 1)
-        x = self.A.get_at(i)
-        if x.key > k:
-            return x
-        if i + 1 < len(self):
-            return self.A.get_at(i + 1)
-        else:
-            return None
+        i = self._lower_bound(k)
+        if (i < len(self.K)) and (self.K[i] == k):
+            i += 1
+        if i < len(self.K):
+            return self.A.get_at(i)
+        return None
 
     def find_prev(self, k):                                         # O(log n)
-        if len(self) == 0:
-            return None
-        i = self._binary_search(k, 0, len(self) - 1)
-        x = self.A.get_at(i)
-        if x.key < k:
-            return x
+        i = self._lower_bound(k)
         if i > 0:
             return self.A.get_at(i - 1)
-        else:
-            return None
+        return None
 
     def insert(self, x):                                            # O(n)
-        if len(self) == 0:
-            self.A.insert_first(x)
-        else:
-            i = self._binary_search(x.key, 0, len(self) - 1)
-            k = self.A.get_at(i).key
-            if x.key == k:
-                self.A.set_at(i, x)
-                return False
-            if k > x.key:
-                self.A.insert_at(i, x)
-            else:
-                self.A.insert_at(i+ 1, x)
-            return True
+        i = self._lower_bound(x.key)
+        if (i < len(self.K)) and (self.K[i] == x.key):
+            self.A.set_at(i, x)
+            return False
+        self.A.insert_at(i, x)
+        self.K.insert(i, x.key)
+        self.E = self.P = None
+        return True
 
     def delete(self, k):                                            # O(n)
         if len(self) == 0:
             return None
-        else:
-            i = self._binary_search(k, 0, len(self) - 1)
-            assert self.A.get_at(i).key == k
-            return self.A.delete_at(i)
+        i = self._lower_bound(k)
+        assert (i < len(self.K)) and (self.K[i] == k)
+        self.K.pop(i)
+        self.E = self.P = None
+        return self.A.delete_at(i)
+
+    def range_iter(self, lo, hi):                                   # O(log n + output)
+        i, j = self._lower_bound(lo), self._lower_bound(hi)
+        for t in range(i, j):
+            yield self.A.get_at(t)
+
+    def range_count(self, lo, hi):                                  # O(log n)
+        return max(self._lower_bound(hi) - self._lower_bound(lo), 0)
+
+    def range_delete(self, lo, hi):                                 # O(n)
+        i, j = self._lower_bound(lo), self._lower_bound(hi)
+        if i >= j:
+            return []
+        del self.K[i:j]
+        self.E = self.P = None
+        return self.A.delete_range(i, j)
+
+    def rank(self, k):                                              # O(log n)
+        return self._lower_bound(k)
+
+    def select(self, i):                                            # O(1)
+        assert 0 <= i < len(self)
+        return self.A.get_at(i)
+
+    def _lower_bounds(self, Q):                                     # O(min(k log n, n + k log k))
+        K, n, k = self.K, len(self.K), len(Q)
+        if k * n.bit_length() < n + k:
+            return [self._lower_bound(q) for q in Q]
+        order = range(k)
+        if any(Q[t + 1] < Q[t] for t in range(k - 1)):
+            order = sorted(order, key = lambda t: Q[t])
+        out = [0] * k
+        i = 0
+        for t in order:
+            while (i < n) and (K[i] < Q[t]):
+                i += 1
+            out[t] = i
+        return out
+
+    def find_many(self, Q):                                         # O(min(k log n, n + k log k))
+        Q = [q for q in Q]
+        out = []
+        for q, i in zip(Q, self._lower_bounds(Q)):
+            if (i < len(self.K)) and (self.K[i] == q):
+                out.append(self.A.get_at(i))
+            else:
+                out.append(None)
+        return out
+
+    def find_next_many(self, Q):                                    # O(min(k log n, n + k log k))
+        Q = [q for q in Q]
+        out = []
+        for q, i in zip(Q, self._lower_bounds(Q)):
+            if (i < len(self.K)) and (self.K[i] == q):
+                i += 1
+            out.append(self.A.get_at(i) if i < len(self.K) else None)
+        return out
+
+    def find_prev_many(self, Q):                                    # O(min(k log n, n + k log k))
+        Q = [q for q in Q]
+        return [self.A.get_at(i - 1) if i > 0 else None for i in self._lower_bounds(Q)]
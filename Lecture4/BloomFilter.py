@@ -0,0 +1,180 @@
+# ---------------------------- Bloom Filter ---------------------------- #
+# Many finds look for a key that is not in the set, and each of them still hashes into a chain or runs a binary search.
+# A Bloom filter is a small summary of the set of keys that answers "is k possibly in the set?":
+#   it can answer yes for a key that is not there (a false positive), but never answers no for a key that is,
+#   so when it says no, find can return None without touching the set at all.
+
+# ---- Blocked Bloom Filter ---- #
+# A classic Bloom filter sets k bits at k independent random positions of a bit array for each inserted key,
+#   and a key may be present only if all k of its bits are set.
+# We use the blocked variant: the bit array is split into 64-bit words,
+#   one hash picks a single word for the key, and a second hash picks the k bits inside that word.
+# Then adding or testing a key touches one word, with one mask operation, instead of k scattered bits.
+# Both hashes come from the universal family h(w) = (a * w) mod P with P = 2^61 - 1:
+#   the first is reduced mod the number of words, and the 61 bits of the second give up to 10 bit positions of 6 bits each.
+# With b bits per key and k = 4 bits per key, about 2 - 3% of absent keys are false positives at b = 10.
+
+# ---- Deleting and Growing ---- #
+# Bits cannot be cleared on delete, since other keys may share them,
+#   so a deleted key keeps answering yes until the filter is rebuilt from the keys in the set.
+# A filter is sized for a capacity of keys; the set rebuilds it (in O(n) time) for twice its current size
+#   when more keys than the capacity have been added, or when half as many keys have been deleted as remain,
+#   so the rebuilds add O(1) amortized time per operation.
+
+# ---- Statistics ---- #
+# bloom_stats() reports the memory used by the filter, the false positive rate expected from its fill,
+#   and the false positive rate measured over the finds since the last rebuild,
+#   which also counts finds of deleted keys that the filter still remembers.
+
+from array import array
+from random import randint
+from Lecture3.SortedArraySet import SortedArraySet
+from Lecture4.HashTableSet import HashTableSet
+
+
+class BloomFilter:
+    P = 2 ** 61 - 1
+
+    def __init__(self, capacity, b = 10, k = 4):                        # O(capacity)
+        assert 1 <= k <= 10
+        self.capacity = max(capacity, 1)
+        self.k = k
+        self.B = array('Q', bytes(8 * max(1, self.capacity * b // 64)))
+        self.a = randint(1, self.P - 1)
+        self.a2 = randint(1, self.P - 1)
+        self.count = 0                                                  # keys added
+        self.stale = 0                                                  # keys deleted since built
+        self.queries = 0                                                # finds asked
+        self.negatives = 0                                              # finds answered by the filter
+        self.false_positives = 0                                        # finds passed on for absent keys
+
+    def _probe(self, w):                                                # O(k)
+        i = ((self.a * w) % self.P) % len(self.B)
+        h = (self.a2 * w) % self.P
+        mask = 0
+        for _ in range(self.k):
+            mask |= 1 << (h & 63)
+            h >>= 6
+        return i, mask
+
+    def add(self, w):                                                   # O(k)
+        i, mask = self._probe(w)
+        self.B[i] |= mask
+        self.count += 1
+
+    def might_contain(self, w):                                         # O(k)
+        i, mask = self._probe(w)
+        return self.B[i] & mask == mask
+
+    def nbytes(self):                                                   # O(1)
+        return len(self.B) * self.B.itemsize
+
+    def fill(self):                                                     # O(m)
+        return sum(bin(x).count('1') for x in self.B) / (64 * len(self.B))
+
+
+class BloomFilteredSet:
+    # Adds a Bloom filter in front of find to any set, through super(), e.g. BloomHashTableSet below.
+
+    def __init__(self, *args, bloom_bits = 10, bloom_k = 4, **kwargs):  # O(1)
+        self.bloom_bits = bloom_bits
+        self.bloom_k = bloom_k
+        self.bloom = BloomFilter(1, bloom_bits, bloom_k)
+        self.bloom_rebuilds = 0
+        super().__init__(*args, **kwargs)
+
+    def _bloom_word(self, k):                                           # O(1)
+        if isinstance(k, int):
+            return k
+        return hash(k)
+
+    def _bloom_rebuild(self):                                           # O(n)
+        self.bloom = BloomFilter(2 * len(self), self.bloom_bits, self.bloom_k)
+        for x in self:
+            self.bloom.add(self._bloom_word(x.key))
+        self.bloom_rebuilds += 1
+
+    def _bloom_check(self):                                             # O(1) a
+        F = self.bloom
+        if (F.count > F.capacity) or (2 * F.stale > max(len(self), 16)):
+            self._bloom_rebuild()
+
+    def build(self, X):                                                 # O(T(build) + n)
+        super().build(X)
+        self._bloom_rebuild()
+
+    def find(self, k):                                                  # O(1) if filtered out
+        F = self.bloom
+        F.queries += 1
+        if not F.might_contain(self._bloom_word(k)):
+            F.negatives += 1
+            return None
+        x = super().find(k)
+        if x is None:
+            F.false_positives += 1
+        return x
+
+    def insert(self, x):                                                # O(T(insert))
+        added = super().insert(x)
+        if added is not False:                                          # only skip known replacements, never miss a key
+            self.bloom.add(self._bloom_word(x.key))
+            self._bloom_check()
+        return added
+
+    def delete(self, k):                                                # O(T(delete))
+        x = super().delete(k)
+        if x is not None:
+            self.bloom.stale += 1
+            self._bloom_check()
+        return x
+
+    def bloom_stats(self):                                              # O(m)
+        F = self.bloom
+        absent = F.negatives + F.false_positives                        # finds of keys not in the set
+        return {
+            'keys': len(self),
+            'bytes': F.nbytes(),
+            'bits_per_key': 8 * F.nbytes() / max(len(self), 1),
+            'expected_fp_rate': F.fill() ** F.k,
+            'measured_fp_rate': F.false_positives / absent if absent else 0.0,
+            'queries': F.queries,
+            'filtered': F.negatives,
+            'false_positives': F.false_positives,
+            'stale_keys': F.stale,
+            'rebuilds': self.bloom_rebuilds,
+        }
+
+
+class BloomHashTableSet(BloomFilteredSet, HashTableSet):
+    pass
+
+
+class BloomSortedArraySet(BloomFilteredSet, SortedArraySet):
+    # SortedArraySet's batch operations do not go through insert, so they update the filter here
+
+    def insert_many(self, X):                                           # O(T(insert_many) + k)
+        X = [x for x in X]
+        count = super().insert_many(X)
+        for x in X:
+            self.bloom.add(self._bloom_word(x.key))
+        self._bloom_check()
+        return count
+
+    def find_many(self, K):                                             # O(T(find_many) + k)
+        K = [k for k in K]
+        F = self.bloom
+        maybe = [t for t in range(len(K)) if F.might_contain(self._bloom_word(K[t]))]
+        found = super().find_many([K[t] for t in maybe])
+        out = [None] * len(K)
+        for t, x in zip(maybe, found):
+            out[t] = x
+        F.queries += len(K)
+        F.negatives += len(K) - len(maybe)
+        F.false_positives += sum(1 for x in found if x is None)
+        return out
+
+    def range_delete(self, lo, hi):                                     # O(n)
+        X = super().range_delete(lo, hi)
+        self.bloom.stale += len(X)
+        self._bloom_check()
+        return X
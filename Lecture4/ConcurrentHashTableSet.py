@@ -0,0 +1,125 @@
+# ---------------------------- Concurrent Hash Table Set ---------------------------- #
+# When many threads share one hash table, the simplest way to keep it consistent is one lock around every operation,
+#   but then only one thread can use the table at a time, even when the threads touch unrelated keys.
+# Lock striping instead partitions the keys into s segments by a separate hash of the key,
+#   and stores each segment in its own hash table set with its own lock (and its own resizing).
+# An operation only locks the segment of its key, so operations on different segments never wait for each other.
+
+# ---- Reads Without Locks ---- #
+# find does not lock at all. A chained hash table set only changes its table in ways a concurrent reader can tolerate:
+#   • a resize builds a complete new table and then replaces the reference self.A in one step,
+#     leaving the old table and its chains untouched;
+#   • a chain insertion links a fully built node at the end of the chain, a deletion unlinks a node
+#     without changing the unlinked node's item or next pointer, and a replacement overwrites one item pointer.
+# So a reader that takes one snapshot of the table (A = segment.A), hashes into it, and walks the chain
+#   sees either the state before or after each concurrent change, never a broken one.
+# This relies on chains that never clear or recycle deleted nodes: LinkedListSeq with pool = 0 (the default
+#   used by HashTableSet.chain_set) leaves a deleted node untouched, but with a node pool it clears the node's item
+#   and reuses the node, and a reader standing on it would see None or jump into another chain.
+# In CPython the global interpreter lock still runs one thread's bytecode at a time,
+#   so striping mainly removes waiting on a single lock; on a free-threaded build, reads and other segments run in parallel.
+
+# ---- Atomic Operations ---- #
+#   insert_if_absent(x) - insert x unless an item with key x.key exists; return the existing item, or None if x was inserted
+#   compute(k, f) - replace the item y with key k (None if absent) by f(y), or delete it if f(y) is None; return f(y)
+# Both run while holding the segment's lock, so no other thread can change key k in between.
+
+from random import randint
+from threading import Lock
+from Lecture4.HashTableSet import HashTableSet
+
+
+class ConcurrentHashTableSet:
+    def __init__(self, s = 16, r = 200, prehash = None):                # O(s)
+        self.segments = [HashTableSet(r, prehash) for _ in range(s)]
+        self.locks = [Lock() for _ in range(s)]
+        self.prehash = prehash
+        self.p = 2 ** 31 - 1
+        self.a = randint(1, self.p - 1)
+
+    def __len__(self):                                                  # O(s)
+        return sum(len(S) for S in self.segments)
+
+    def __iter__(self):                                                 # O(n)
+        for i in range(len(self.segments)):
+            with self.locks[i]:
+                X = list(self.segments[i])
+            yield from X
+
+    def _segment(self, k):                                              # O(1)
+        w = k if self.prehash is None else self.prehash(k)
+        return ((self.a * w) % self.p) % len(self.segments)
+
+    def build(self, X):                                                 # O(n) e
+        groups = [[] for _ in self.segments]
+        for x in X:
+            groups[self._segment(x.key)].append(x)
+        for i in range(len(self.segments)):
+            with self.locks[i]:
+                self.segments[i].insert_many(groups[i])
+
+    def find(self, k):                                                  # O(1) e, without locking
+        S = self.segments[self._segment(k)]
+        A = S.A
+        return A[S._hash(S._word(k), len(A))].find(k)
+
+    def insert(self, x):                                                # O(1) a e
+        i = self._segment(x.key)
+        with self.locks[i]:
+            return self.segments[i].insert(x)
+
+    def delete(self, k):                                                # O(1) a e
+        i = self._segment(k)
+        with self.locks[i]:
+            S = self.segments[i]
+            if S.find(k) is None:
+                return None
+            return S.delete(k)
+
+    def insert_if_absent(self, x):                                      # O(1) a e
+        i = self._segment(x.key)
+        with self.locks[i]:
+            S = self.segments[i]
+            y = S.find(x.key)
+            if y is None:
+                S.insert(x)
+            return y
+
+    def compute(self, k, f):                                            # O(1) a e + O(T(f))
+        i = self._segment(k)
+        with self.locks[i]:
+            S = self.segments[i]
+            y = f(S.find(k))
+            if y is None:
+                if S.find(k) is not None:
+                    S.delete(k)
+            else:
+                assert y.key == k
+                S.insert(y)
+            return y
+
+    # Order operations lock and scan each segment in turn, so they are not atomic across segments.
+
+    def _best(self, f, better):                                         # O(n)
+        out = None
+        for i in range(len(self.segments)):
+            with self.locks[i]:
+                x = f(self.segments[i])
+            if (x is not None) and ((out is None) or better(x.key, out.key)):
+                out = x
+        return out
+
+    def find_min(self):                                                 # O(n)
+        return self._best(lambda S: S.find_min(), lambda a, b: a < b)
+
+    def find_max(self):                                                 # O(n)
+        return self._best(lambda S: S.find_max(), lambda a, b: a > b)
+
+    def find_next(self, k):                                             # O(n)
+        return self._best(lambda S: S.find_next(k), lambda a, b: a < b)
+
+    def find_prev(self, k):                                             # O(n)
+        return self._best(lambda S: S.find_prev(k), lambda a, b: a > b)
+
+    def iter_order(self):                                               # O(n log n)
+        yield from sorted(self, key = lambda x: x.key)
@@ -0,0 +1,130 @@
+# ---------------------------- Cuckoo Hashing ---------------------------- #
+# Chaining and open addressing both have expected O(1) time operations,
+#   but an unlucky key may still have to be compared against a long chain or a long run of full slots.
+# Cuckoo hashing guarantees that find looks in at most two slots.
+# We keep two tables A and B of m slots each, and two hash functions h1 and h2 drawn from the same universal family,
+#   and store every item x either at A[h1(x.key)] or at B[h2(x.key)].
+# To find key k, look at A[h1(k)] and B[h2(k)], and nowhere else: worst case O(1).
+# To insert x, put x at A[h1(x.key)]; if that slot held an item y, y is kicked out and moves to its slot in B,
+#   possibly kicking out another item, which moves to its slot in A, and so on, like a cuckoo chick pushing out eggs.
+# If the items keep the table at most half full, this chain of moves ends in expected O(1) steps,
+#   but occasionally it runs into a cycle.
+# We stop after a bounded number of moves and put the homeless item in a small stash of at most s items,
+#   which find also checks; the stash makes a full rebuild much less likely.
+# Only when the stash is full do we rehash: draw new h1 and h2 and rebuild both tables (growing them if that keeps failing).
+# The tables are rebuilt with m = 2n slots each, and again when n reaches m or falls to m / 4,
+#   so insert and delete take expected O(1) amortized time.
+
+from random import randint
+from Lecture4.HashTableSet import HashTableSet
+
+
+class CuckooHashTableSet(HashTableSet):
+    def __init__(self, s = 4, prehash = None):                          # O(1)
+        self.B = []
+        self.stash = []
+        self.s = s                                                      # max number of stashed items
+        self.a2 = 1
+        super().__init__(200, prehash)
+
+    def __iter__(self):                                                 # O(n)
+        for T in (self.A, self.B, self.stash):
+            for x in T:
+                if x is not None:
+                    yield x
+
+    def _hash2(self, k, m):                                             # O(1)
+        return ((self.a2 * k) % self.p) % m
+
+    def _compute_bounds(self):                                          # O(1)
+        self.upper = len(self.A)                                        # keep both tables at most half full
+        self.lower = len(self.A) // 4
+
+    def _resize(self, n):                                               # O(n) e
+        if (self.lower >= n) or (n >= self.upper):
+            self._rebuild(max(n, 1) * 2)
+
+    def _rebuild(self, m):                                              # O(n) e
+        X = list(self)
+        tries = 0
+        while True:
+            self.a = randint(1, self.p - 1)
+            self.a2 = randint(1, self.p - 1)
+            self.A, self.B, self.stash = [None] * m, [None] * m, []
+            if all(self._place_or_stash(x) for x in X):
+                break
+            tries += 1
+            if tries % 4 == 0:                                          # keeps failing, so grow the tables
+                m *= 2
+        self._compute_bounds()
+
+    def _place(self, x):                                                # O(log n)
+        # move x into the tables, kicking items back and forth; return the homeless item, if any
+        m = len(self.A)
+        for _ in range(3 * m.bit_length()):
+            h = self._hash(self._item_word(x), m)
+            x, self.A[h] = self.A[h], x
+            if x is None:
+                return None
+            h = self._hash2(self._item_word(x), m)
+            x, self.B[h] = self.B[h], x
+            if x is None:
+                return None
+        return x
+
+    def _place_or_stash(self, x):                                       # O(log n)
+        y = self._place(x)
+        if y is None:
+            return True
+        if len(self.stash) < self.s:
+            self.stash.append(y)
+            return True
+        self.stash.append(y)                                            # keep y, so a rebuild includes it
+        return False
+
+    def _locate(self, k):                                               # O(1)
+        # return (T, i) such that T[i] holds the item with key k, or None
+        w = self._word(k)
+        h = self._hash(w, len(self.A))
+        if (self.A[h] is not None) and (self.A[h].key == k):
+            return self.A, h
+        h = self._hash2(w, len(self.B))
+        if (self.B[h] is not None) and (self.B[h].key == k):
+            return self.B, h
+        for i in range(len(self.stash)):
+            if self.stash[i].key == k:
+                return self.stash, i
+        return None
+
+    def find(self, k):                                                  # O(1)
+        slot = self._locate(k)
+        if slot is None:
+            return None
+        T, i = slot
+        return T[i]
+
+    def insert(self, x):                                                # O(1) a e
+        slot = self._locate(x.key)
+        if slot is not None:
+            T, i = slot
+            T[i] = x
+            return False
+        self._resize(self.size + 1)
+        self.size += 1
+        if not self._place_or_stash(x):
+            self._rebuild(len(self.A))
+        return True
+
+    def delete(self, k):                                                # O(1) a e
+        slot = self._locate(k)
+        if slot is None:
+            return None
+        T, i = slot
+        x = T[i]
+        if T is self.stash:
+            T.pop(i)
+        else:
+            T[i] = None
+        self.size -= 1
+        self._resize(self.size)
+        return x
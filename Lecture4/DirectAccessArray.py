@@ -32,52 +32,199 @@
 # How can we overcome this obstacle? The answer is hashing!
 
 
+# ---- Bitset Summary ---- #
+# To speed up the order operations, we also keep a summary of which slots are used, as a tree of 64-bit words.
+# Level 0 has one bit per key, packed into u / 64 words; bit b of word w is 1 when slot 64w + b holds an item.
+# Each higher level has one bit per word of the level below, which is 1 when that word is not 0,
+#   up to a top level of a single word, so there are about log_64 u levels (4 levels for u up to 2^24).
+# Insert and delete set or clear the key's bit, and only go up a level when a word changes between 0 and not 0,
+#   taking O(log_64 u) time, which is at most a small constant number of word operations for any practical u.
+# To find the next used slot at or after k, we look for a 1 bit at or after k's bit in k's word;
+#   if there is none, we go up a level and look after that word's bit, and so on,
+#   then go back down, taking the lowest 1 bit of each word below.
+# A word operation finds the lowest or highest 1 bit of a word at once,
+#   so find_next, find_prev, find_min, find_max, delete_min, and delete_max take O(log_64 u) time instead of O(u).
+# Here find_next(k) and find_prev(k) return the item with the next larger or smaller key than k, as in the Set Interface.
+
+
 class DirectAccessArray:
     def __init__(self, u):                                          # O(u)
+        self.u = u
         self.A = [None] * u
+        self.W = self._widths(u)                                    # number of words of each summary level
+        self.S = [[0] * m for m in self.W]                          # summary levels of 64-bit words
+
+    def _widths(self, u):                                           # O(log_64 u)
+        W, m = [], u
+        while True:
+            m = max(1, (m + 63) // 64)
+            W.append(m)
+            if m == 1:
+                return W
+
+    def _word(self, l, w):                                          # O(1)
+        return self.S[l][w]
+
+    def _put(self, l, w, bits):                                     # O(1)
+        self.S[l][w] = bits
+
+    def _set(self, k):                                              # O(log_64 u)
+        for l in range(len(self.W)):
+            w, b = k >> 6, k & 63
+            was = self._word(l, w)
+            self._put(l, w, was | (1 << b))
+            if was:
+                break
+            k = w
+
+    def _clear(self, k):                                            # O(log_64 u)
+        for l in range(len(self.W)):
+            w, b = k >> 6, k & 63
+            bits = self._word(l, w) & ~(1 << b)
+            self._put(l, w, bits)
+            if bits:
+                break
+            k = w
+
+    def _next(self, k):                                             # O(log_64 u)
+        # smallest used slot at or after k, or None
+        l = 0
+        while True:
+            if l == len(self.W):
+                return None
+            w, b = k >> 6, k & 63
+            if w >= self.W[l]:
+                return None
+            bits = (self._word(l, w) >> b) << b                         # bits b and up
+            if bits:
+                k = (w << 6) + (bits & -bits).bit_length() - 1
+                break
+            k, l = w + 1, l + 1
+        while l > 0:
+            l -= 1
+            bits = self._word(l, k)
+            k = (k << 6) + (bits & -bits).bit_length() - 1
+        return k
+
+    def _prev(self, k):                                             # O(log_64 u)
+        # largest used slot at or before k, or None
+        k = min(k, self.u - 1)
+        l = 0
+        while True:
+            if (l == len(self.W)) or (k < 0):
+                return None
+            w, b = k >> 6, k & 63
+            bits = self._word(l, w) & ((2 << b) - 1)                    # bits b and down
+            if bits:
+                k = (w << 6) + bits.bit_length() - 1
+                break
+            k, l = w - 1, l + 1
+        while l > 0:
+            l -= 1
+            bits = self._word(l, k)
+            k = (k << 6) + bits.bit_length() - 1
+        return k
 
     def find(self, k):                                              # O(1)
         return self.A[k]
 
-    def insert(self, x):                                            # O(1)
+    def insert(self, x):                                            # O(log_64 u)
+        if self.A[x.key] is None:
+            self._set(x.key)
         self.A[x.key] = x
 
-    def delete(self, k):                                            # O(1)
+    def delete(self, k):                                            # O(log_64 u)
         x = self.A[k]
-        self.A[k] = None
+        if x is not None:
+            self.A[k] = None
+            self._clear(k)
         return x
 
-    def find_next(self, k):                                         # O(u)
-        for i in range(k, len(self.A)):
-            if self.A[i] is not None:
-                return self.A[i]
-
-    def find_prev(self, k):                                         # O(u)
-        for i in range(k, -1, -1):
-            if self.A[i] is not None:
-                return self.A[i]
-
-    def find_max(self):                                             # O(u)
-        for i in range(len(self.A) - 1, -1, -1):
-            if self.A[i] is not None:
-                return self.A[i]
-
-    def find_min(self):                                             # O(u)
-        for i in range(0, len(self.A)):
-            if self.A[i] is not None:
-                return self.A[i]
-
-    def delete_max(self):                                           # O(u)
-        for i in range(len(self.A) - 1, -1, -1):
-            x = self.A[i]
-            if x is not None:
-                self.A[i] = None
-                return x
-
-    def delete_min(self):                                           # O(u)
-        for i in range(0, len(self.A)):
-            x = self.A[i]
-            if x is not None:
-                self.A[i] = None
-                return x
+    def find_next(self, k):                                         # O(log_64 u)
+        i = self._next(max(k + 1, 0))
+        return None if i is None else self.find(i)
+
+    def find_prev(self, k):                                         # O(log_64 u)
+        i = self._prev(k - 1)
+        return None if i is None else self.find(i)
+
+    def find_max(self):                                             # O(log_64 u)
+        i = self._prev(self.u - 1)
+        return None if i is None else self.find(i)
 
+    def find_min(self):                                             # O(log_64 u)
+        i = self._next(0)
+        return None if i is None else self.find(i)
+
+    def delete_max(self):                                           # O(log_64 u)
+        i = self._prev(self.u - 1)
+        return None if i is None else self.delete(i)
+
+    def delete_min(self):                                           # O(log_64 u)
+        i = self._next(0)
+        return None if i is None else self.delete(i)
+
+
+# ------------------- Paged Direct Access Array ------------------- #
+# A direct access array allocates all u slots up front, which is impossible for 32 or 48-bit keys,
+#   even when only a few million keys are in use.
+# A paged direct access array splits the key range into pages of 2^b consecutive keys (4096 for b = 12),
+#   and only allocates the page of a key the first time an item with a key in that page is inserted.
+# Key k lives in slot k mod 2^b of page k // 2^b, both computed with a shift and a mask.
+# A directory maps each page number to its page; it is a hash map (a Python dict), since even a list of u / 2^b pages
+#   would be too large for a 48-bit key range, so find, insert, and delete take expected O(1) time
+#   (plus O(log_64 u) to update the summary).
+# Each page counts its items, and a page is freed as soon as its last item is deleted.
+# The summary words are stored in hash maps too, keeping only words that are not 0,
+#   so the space used is O(n 2^b) for the pages in the worst case plus O(n log_64 u) for the summary,
+#   growing with the number of stored items rather than with u.
+
+class PagedDirectAccessArray(DirectAccessArray):
+    def __init__(self, u, b = 12):                                  # O(log_64 u)
+        self.u = u
+        self.b = b                                                  # 2^b keys per page
+        self.pages = {}                                             # page number -> page
+        self.used = {}                                              # page number -> number of items in page
+        self.W = self._widths(u)
+        self.S = [{} for _ in self.W]                               # summary levels, without words that are 0
+
+    def _word(self, l, w):                                          # O(1) e
+        return self.S[l].get(w, 0)
+
+    def _put(self, l, w, bits):                                     # O(1) e
+        if bits:
+            self.S[l][w] = bits
+        else:
+            self.S[l].pop(w, None)
+
+    def find(self, k):                                              # O(1) e
+        page = self.pages.get(k >> self.b)
+        if page is None:
+            return None
+        return page[k & ((1 << self.b) - 1)]
+
+    def insert(self, x):                                            # O(2^b) on a new page, else O(log_64 u) e
+        k = x.key
+        assert 0 <= k < self.u
+        p, i = k >> self.b, k & ((1 << self.b) - 1)
+        page = self.pages.get(p)
+        if page is None:
+            page = self.pages[p] = [None] * (1 << self.b)
+            self.used[p] = 0
+        if page[i] is None:
+            self.used[p] += 1
+            self._set(k)
+        page[i] = x
+
+    def delete(self, k):                                            # O(log_64 u) e
+        p, i = k >> self.b, k & ((1 << self.b) - 1)
+        page = self.pages.get(p)
+        if (page is None) or (page[i] is None):
+            return None
+        x, page[i] = page[i], None
+        self.used[p] -= 1
+        if self.used[p] == 0:
+            del self.pages[p]
+            del self.used[p]
+        self._clear(k)
+        return x
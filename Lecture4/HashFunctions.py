@@ -0,0 +1,58 @@
+# -------------------------------- Hash Functions -------------------------------- #
+# The hash table set hashes an integer key k with the universal family h(k) = ((a * k) mod p) mod m,
+#   so it only works for integer keys.
+# To store items with other keys, like strings, bytes, or tuples, we first map each key to an integer,
+#   called a pre-hash, and then hash that integer as before.
+# A fixed pre-hash (like summing the characters of a string) lets an adversary choose many keys with the same pre-hash,
+#   which all collide no matter how a is chosen, so the pre-hash should itself be drawn at random from a universal family.
+
+# ---- Polynomial Hashing ---- #
+# Keys of different lengths need a family that handles any number of words.
+# We split the key into machine words w_1, ..., w_L (7 bytes each, so every word is less than P),
+#   and evaluate the polynomial w_1 x^(L-1) + ... + w_L at a random point x, modulo the Mersenne prime P = 2^61 - 1.
+# Two different keys of at most L words collide only if x is a root of the difference of their polynomials,
+#   which has at most L roots, so they collide with probability at most L / P.
+# The length of the key is appended as a final word, and a tag word for the type of the key starts the polynomial,
+#   so that e.g. 'ab', b'ab', and ('a', 'b') do not collide by construction.
+# A tuple is hashed as the polynomial of the pre-hashes of its elements (reduced modulo P).
+# Integer keys are returned unchanged, so integer-keyed tables behave exactly as before,
+#   and any other key falls back to Python's built-in hash.
+
+# ---- Caching ---- #
+# Pre-hashing a long key takes time proportional to its length,
+#   and a table rehashes every item whenever it resizes.
+# So the hash table set stores the pre-hash of an item's key on the item itself (x.key_hash) the first time it is computed,
+#   together with the pre-hash function that computed it, and reuses it on every later resize and re-insertion;
+#   the key of a stored item must then not change.
+# The pre-hash only depends on the key and the random point x, so one PolynomialHash can be shared by many tables,
+#   which then share the cached words; each table still draws its own random a for the final step.
+
+from random import randint
+
+
+class PolynomialHash:
+    P = 2 ** 61 - 1
+
+    def __init__(self):                                                 # O(1)
+        self.x = randint(1, self.P - 1)
+
+    def __call__(self, k):                                              # O(len(k))
+        if isinstance(k, int):
+            return k
+        if isinstance(k, str):
+            return self._bytes(k.encode('utf-8'), 1)
+        if isinstance(k, (bytes, bytearray)):
+            return self._bytes(k, 2)
+        if isinstance(k, tuple):
+            return self._poly([self(e) % self.P for e in k] + [len(k)], 3)
+        return hash(k)
+
+    def _bytes(self, b, tag):                                           # O(len(b))
+        W = [int.from_bytes(b[i:i + 7], 'little') for i in range(0, len(b), 7)]
+        return self._poly(W + [len(b)], tag)
+
+    def _poly(self, W, tag):                                            # O(len(W))
+        h, x, P = tag, self.x, self.P
+        for w in W:
+            h = (h * x + w) % P
+        return h
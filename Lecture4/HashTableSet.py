@@ -50,13 +50,14 @@ from random import randint
 
 
 class HashTableSet:
-    def __init__(self, r = 200):                                        # O(1)
+    def __init__(self, r = 200, prehash = None):                        # O(1)
         self.chain_set = setFromSequence(LinkedListSeq)
         self.A = []
         self.size = 0
         self.r = r                                                      # 100 / self.r = fill ratio
         self.p = 2 ** 31 - 1
         self.a = randint(1, self.p - 1)
+        self.prehash = prehash                                          # maps non-integer keys to integers
         self._compute_bounds()
         self._resize(0)
 
@@ -68,12 +69,36 @@ class HashTableSet:
             yield from x
 
     def build(self, X):                                                 # O(n) e
-        for x in X:
-            self.insert(x)
+        self.insert_many(X)
+
+    # Keys that are not integers are first mapped to an integer word by a pre-hash function, e.g. PolynomialHash
+    #   (see HashFunctions.py); the word of a stored item's key is cached on the item as x.key_hash.
+
+    def _word(self, k):                                                 # O(1) or O(T(prehash))
+        if self.prehash is None:
+            return k
+        return self.prehash(k)
+
+    def _item_word(self, x):                                            # O(1) after the first call
+        if self.prehash is None:
+            return x.key
+        cached = getattr(x, 'key_hash', None)
+        if cached and cached[0] is self.prehash:
+            return cached[1]
+        w = self.prehash(x.key)
+        try:
+            x.key_hash = (self.prehash, w)
+        except AttributeError:                                          # item without a __dict__
+            pass
+        return w
 
     def _hash(self, k, m):                                              # O(1)
         return ((self.a * k) % self.p) % m
 
+    def _hash_many(self, K, m):                                         # O(k)
+        a, p = self.a, self.p
+        return [((a * k) % p) % m for k in K]
+
     def _compute_bounds(self):                                          # O(1)
         self.upper = len(self.A)
         self.lower = len(self.A) * 100 * 100 // (self.r * self.r)
@@ -85,19 +110,19 @@ class HashTableSet:
                 f += 1
             m = max(n, 1) * f
             A = [self.chain_set() for _ in range(m)]
-            for x in self:
-                h = self._hash(x.key, m)
+            X = list(self)
+            for x, h in zip(X, self._hash_many([self._item_word(x) for x in X], m)):
                 A[h].insert(x)
             self.A = A
             self._compute_bounds()
 
     def find(self, k):                                                  # O(1) e
-        h = self._hash(k, len(self.A))
+        h = self._hash(self._word(k), len(self.A))
         return self.A[h].find(k)
 
     def insert(self, x):                                                # O(1) a e
         self._resize(self.size + 1)
-        h = self._hash(x.key, len(self.A))
+        h = self._hash(self._item_word(x), len(self.A))
         added = self.A[h].insert(x)
         if added:
             self.size += 1
@@ -105,12 +130,45 @@ class HashTableSet:
 
     def delete(self, k):                                                # O(1) a e
         assert len(self) > 0
-        h = self._hash(k, len(self.A))
+        h = self._hash(self._word(k), len(self.A))
         x = self.A[h].delete(k)
-        self.size -= 1
+        if x is not None:
+            self.size -= 1
         self._resize(self.size)
         return x
 
+    # ---- Batch Operations ---- #
+    # Inserting n items one at a time triggers a resize every time the size crosses a bound,
+    #   rehashing every stored item O(log n) times in total.
+    # Instead, insert_many (and so build) resizes once for the final size before placing any item,
+    #   and does not shrink the table again until every item is placed,
+    #   so the inserts that follow never resize; delete_many likewise resizes at most once, at the end.
+    # Every item still goes through insert, find, or delete, so a subclass that overrides them
+    #   (another engine, or one keeping an index or filter in sync) gets correct batch operations for free.
+
+    def insert_many(self, X):                                           # O(k) a e
+        X = [x for x in X]
+        self._resize(self.size + len(X))
+        self.lower = -1                                                 # no shrinking while the batch is placed
+        try:
+            count = sum(1 for x in X if self.insert(x))
+        finally:
+            self._compute_bounds()
+        self._resize(self.size)
+        return count
+
+    def find_many(self, K):                                             # O(k) e
+        return [self.find(k) for k in K]
+
+    def delete_many(self, K):                                           # O(k) a e
+        self.lower = -1                                                 # shrink once, at the end
+        try:
+            out = [self.delete(k) if self.size else None for k in K]
+        finally:
+            self._compute_bounds()
+        self._resize(self.size)
+        return out
+
     def find_min(self):                                                 # O(n)
         out = None
         for x in self:
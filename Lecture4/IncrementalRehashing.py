@@ -0,0 +1,127 @@
+# ---------------------------- Incremental Rehashing ---------------------------- #
+# A hash table set resizes by rehashing every item into a new table in a single operation.
+# The cost is O(n) amortized over the Θ(n) operations since the last resize, so it is still O(1) amortized,
+#   but the one operation that triggers the resize takes Θ(n) time, which shows up as a long pause.
+# To shorten that pause, we can spread the rehashing out over later operations instead:
+#   when the size crosses a bound, we allocate the new table but keep the old table next to it,
+#   and every following find, insert, or delete also moves the next few (step) chains of the old table into the new one.
+# While both tables exist, an item may be in either table, so find and delete look in the new table, then the old one,
+#   and insert first removes any item with the same key from the old table.
+# Chains of the new table are only created the first time an item hashes to them.
+# With step >= 8 the old table is always empty before the size can cross the new table's bounds
+#   (it holds at most 4 chains per item at the start of a migration, and the bounds are a factor of 2 away);
+#   if it is not, the remaining chains are moved all at once before starting the next resize.
+# The operation that starts a migration still allocates the new table of m = Θ(n) empty slots, so it takes Θ(n) time;
+#   the pause is not gone, but it is one fill of a list with None instead of hashing and moving n items,
+#   and every other operation takes O(step) time.
+
+# The table exposes its progress and worst case pause:
+#   • migration_progress() returns the fraction of the old table already moved (1 when not migrating),
+#   • max_moved is the largest number of items moved by a single operation, and
+#   • max_pause is the longest time in seconds a single operation spent resizing and moving items.
+
+from time import perf_counter
+from Lecture4.HashTableSet import HashTableSet
+
+
+class IncrementalHashTableSet(HashTableSet):
+    def __init__(self, r = 200, step = 8, prehash = None):              # O(1)
+        self.old = None                                                 # old table, while migrating
+        self.moved = 0                                                  # chains of old table already moved
+        self.step = step
+        self.max_moved = 0
+        self.max_pause = 0
+        super().__init__(r, prehash)
+
+    def __iter__(self):                                                 # O(n)
+        for T in (self.A, self.old or ()):
+            for chain in T:
+                if chain:
+                    yield from chain
+
+    def migration_progress(self):                                       # O(1)
+        if self.old is None:
+            return 1
+        return self.moved / len(self.old)
+
+    def _resize(self, n):                                               # O(1), or O(n) when it allocates a new table
+        if (self.lower >= n) or (n >= self.upper):
+            if self.old is not None:
+                self._migrate(len(self.old))
+            f = self.r // 100
+            if self.r % 100:
+                f += 1
+            m = max(n, 1) * f
+            if self.size > 0:
+                self.old, self.moved = self.A, 0
+            self.A = [None] * m
+            self._compute_bounds()
+
+    def _migrate(self, b):                                              # O(b) e
+        # move the next b chains of the old table into the new table, returning the number of items moved
+        if self.old is None:
+            return 0
+        count = 0
+        for i in range(self.moved, min(self.moved + b, len(self.old))):
+            if self.old[i]:
+                for x in self.old[i]:
+                    self._chain(self._hash(self._item_word(x), len(self.A))).insert(x)
+                    count += 1
+            self.old[i] = None
+        self.moved = min(self.moved + b, len(self.old))
+        if self.moved == len(self.old):
+            self.old = None
+        return count
+
+    def _tick(self, n = None):                                          # O(step) e
+        t = perf_counter()
+        if n is not None:
+            self._resize(n)
+        count = self._migrate(self.step)
+        self.max_moved = max(self.max_moved, count)
+        self.max_pause = max(self.max_pause, perf_counter() - t)
+
+    def _chain(self, h):                                                # O(1)
+        if self.A[h] is None:
+            self.A[h] = self.chain_set()
+        return self.A[h]
+
+    def _old_chain(self, w):                                            # O(1)
+        if self.old is None:
+            return None
+        return self.old[self._hash(w, len(self.old))]
+
+    def find(self, k):                                                  # O(1) e
+        self._tick()
+        w = self._word(k)
+        chain = self.A[self._hash(w, len(self.A))]
+        x = chain.find(k) if chain else None
+        if x is None:
+            chain = self._old_chain(w)
+            x = chain.find(k) if chain else None
+        return x
+
+    def insert(self, x):                                                # O(1) e
+        self._tick(self.size + 1)
+        w = self._item_word(x)
+        chain = self._old_chain(w)
+        replaced = bool(chain) and (chain.find(x.key) is not None)
+        if replaced:
+            chain.delete(x.key)
+        added = self._chain(self._hash(w, len(self.A))).insert(x) and not replaced
+        if added:
+            self.size += 1
+        return added
+
+    def delete(self, k):                                                # O(1) e
+        assert len(self) > 0
+        w = self._word(k)
+        chain = self.A[self._hash(w, len(self.A))]
+        x = chain.delete(k) if chain else None
+        if x is None:
+            chain = self._old_chain(w)
+            x = chain.delete(k) if chain else None
+        if x is not None:
+            self.size -= 1
+        self._tick(self.size)
+        return x
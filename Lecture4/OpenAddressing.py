@@ -0,0 +1,89 @@
+# ---------------------------- Open Addressing ---------------------------- #
+# Chaining stores the colliding items somewhere else: a separate chain data structure at every index of the table.
+# Open addressing instead stores every item in the table itself, one item per slot.
+# To insert an item whose hash slot is already taken, we probe the following slots h(k), h(k) + 1, h(k) + 2, ...
+#   (wrapping around at the end of the table) until an empty slot is found; this is called linear probing.
+# To find key k, we probe the same sequence of slots until we find k or reach an empty slot.
+# For this to be fast the table must never get close to full:
+#   we keep the fill ratio at most 100 / r (one half by default), and rebuild the table as it grows and shrinks.
+# Unlike chaining, a slot holds at most one item, so the fill ratio must stay below 1, i.e. r > 100;
+#   otherwise the table could fill every slot, and probing for a missing key would never stop.
+# The keys and items are stored in two parallel flat arrays, K and A,
+#   so a probe compares keys stored next to each other instead of following pointers through a chain of nodes.
+
+# ---- Deletion ---- #
+# We cannot simply empty the slot of a deleted item,
+#   since a later item in the same run of full slots may have probed past it, and would no longer be found.
+# A common fix is to leave a tombstone marking the slot as deleted, but tombstones pile up and slow down searches.
+# Instead we use backward shift deletion: after emptying slot i, scan forward through the run of full slots,
+#   and move back into slot i any item whose hash slot does not lie cyclically in (i, j], then continue from j.
+# Then every remaining item is still reachable from its hash slot, and the table never contains tombstones.
+
+from Lecture4.HashTableSet import HashTableSet
+
+
+class OpenAddressingHashTableSet(HashTableSet):
+    def __init__(self, r = 200, prehash = None):                        # O(1)
+        assert r > 100, 'open addressing needs a fill ratio 100 / r below 1'
+        self.K = []
+        super().__init__(r, prehash)
+
+    def __iter__(self):                                                 # O(n)
+        for x in self.A:
+            if x is not None:
+                yield x
+
+    def _compute_bounds(self):                                          # O(1)
+        self.upper = min(len(self.A) * 100 // self.r, len(self.A) - 1)     # keep at least one slot empty
+        self.lower = self.upper // 4
+
+    def _resize(self, n):                                               # O(n)
+        if (self.lower >= n) or (n >= self.upper):
+            X = list(self)
+            m = max(n, 1) * 2 * self.r // 100
+            self.K = [None] * m
+            self.A = [None] * m
+            for x in X:
+                j = self._slot(x.key, self._item_word(x))
+                self.K[j], self.A[j] = x.key, x
+            self._compute_bounds()
+
+    def _slot(self, k, w = None):                                       # O(1) e
+        # return the slot holding key k (with word w, if already known), or the empty slot ending its probe sequence
+        m = len(self.K)
+        j = self._hash(self._word(k) if w is None else w, m)
+        while (self.K[j] is not None) and (self.K[j] != k):
+            j = (j + 1) % m
+        return j
+
+    def find(self, k):                                                  # O(1) e
+        return self.A[self._slot(k)]
+
+    def insert(self, x):                                                # O(1) a e
+        self._resize(self.size + 1)
+        j = self._slot(x.key, self._item_word(x))
+        added = self.K[j] is None
+        self.K[j], self.A[j] = x.key, x
+        if added:
+            self.size += 1
+        return added
+
+    def delete(self, k):                                                # O(1) a e
+        assert len(self) > 0
+        m = len(self.K)
+        i = self._slot(k)
+        x = self.A[i]
+        if x is None:
+            return None
+        self.K[i] = self.A[i] = None
+        j = (i + 1) % m
+        while self.K[j] is not None:                                    # backward shift
+            h = self._hash(self._item_word(self.A[j]), m)
+            if (h - i - 1) % m >= (j - i) % m:                          # h is not in (i, j]
+                self.K[i], self.A[i] = self.K[j], self.A[j]
+                self.K[j] = self.A[j] = None
+                i = j
+            j = (j + 1) % m
+        self.size -= 1
+        self._resize(self.size)
+        return x
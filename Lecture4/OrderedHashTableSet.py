@@ -0,0 +1,49 @@
+# ---------------------------- Ordered Hash Table Set ---------------------------- #
+# A hash table supports find, insert, and delete in expected O(1) time,
+#   but it keeps no information about the order of the keys,
+#   so find_min, find_max, find_next, and find_prev must look at every item, taking O(n) time,
+#   and iter_order, which calls find_next once per item, takes O(n^2) time.
+# A Set AVL tree (Lecture7/SetAVLTree.py) supports all the order operations in O(log n) time,
+#   but its find takes O(log n) time instead of O(1).
+# We can have the best of both by storing every item in both data structures:
+#   the hash table answers find, and the tree, an ordered secondary index, answers the order queries.
+# Insert and delete update both, taking O(log n) time, and iter_order walks the tree in O(n) time.
+
+# OrderedHashTableSet only calls the hash table through super(),
+#   so it can also add the index to another hash table engine by multiple inheritance, e.g.
+#       class OrderedOpenAddressingHashTableSet(OrderedHashTableSet, OpenAddressingHashTableSet): pass
+
+from Lecture4.HashTableSet import HashTableSet
+from Lecture7.SetAVLTree import SetAVLTree
+
+
+class OrderedHashTableSet(HashTableSet):
+    def __init__(self, *args, **kwargs):                                # O(1)
+        self.order = SetAVLTree()
+        super().__init__(*args, **kwargs)
+
+    def insert(self, x):                                                # O(log n)
+        added = super().insert(x)
+        self.order.insert(x)
+        return added
+
+    def delete(self, k):                                                # O(log n)
+        x = super().delete(k)
+        if x is not None:
+            self.order.delete(k)
+        return x
+
+    def find_min(self):                                                 # O(log n)
+        return self.order.find_min()
+
+    def find_max(self):                                                 # O(log n)
+        return self.order.find_max()
+
+    def find_next(self, k):                                             # O(log n)
+        return self.order.find_next(k)
+
+    def find_prev(self, k):                                             # O(log n)
+        return self.order.find_prev(k)
+
+    def iter_order(self):                                               # O(n)
+        yield from self.order
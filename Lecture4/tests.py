@@ -0,0 +1,89 @@
+import sys
+import unittest
+from random import randrange, random
+from threading import Thread
+from Lecture4.BloomFilter import BloomSortedArraySet
+from Lecture4.ConcurrentHashTableSet import ConcurrentHashTableSet
+from Lecture4.OpenAddressing import OpenAddressingHashTableSet
+from Lecture4.OrderedHashTableSet import OrderedHashTableSet
+
+# Run from the repository root, e.g. python -m pytest Lecture4/tests.py
+
+
+class Item:
+    def __init__(self, k):
+        self.key = k
+
+
+def lock_free_reads(writes = 40000, readers = 3, u = 64):
+    # one writer inserts and deletes random keys while the readers call find on every key without locking
+    H = ConcurrentHashTableSet(s = 2)
+    errors, done = [], []
+
+    def read():
+        try:
+            while not done:
+                for k in range(u):
+                    x = H.find(k)
+                    if (x is not None) and (x.key != k):
+                        errors.append('find(%d) returned key %d' % (k, x.key))
+        except Exception as e:
+            errors.append(repr(e))
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)                                         # switch threads as often as possible
+    threads = [Thread(target = read, daemon = True) for _ in range(readers)]
+    try:
+        for t in threads:
+            t.start()
+        for _ in range(writes):
+            k = randrange(u)
+            if random() < 0.5:
+                H.insert(Item(k))
+            else:
+                H.delete(k)
+    finally:
+        done.append(True)                                               # stop the readers even if the writer failed
+        for t in threads:
+            if t.is_alive():
+                t.join()
+        sys.setswitchinterval(interval)
+    return errors
+
+
+def ordered_batches():
+    # batch operations of a subclass must go through its own insert and delete, keeping the order index in sync
+    H = OrderedHashTableSet()
+    H.build([Item(k) for k in (5, 3, 8)])
+    H.insert_many([Item(1), Item(9)])
+    H.delete_many([8])
+    return [x.key for x in H.iter_order()]
+
+
+def open_addressing_full_table():
+    # a fill ratio of 1 leaves no empty slot to end a probe sequence, so the constructor rejects it
+    try:
+        OpenAddressingHashTableSet(100)
+    except AssertionError:
+        return True
+    return False
+
+
+def bloom_insert_then_find():
+    # an inserted key must be added to the filter, or find would filter it out
+    S = BloomSortedArraySet()
+    X = [Item(k) for k in (7, 2, 9)]
+    for x in X:
+        S.insert(x)
+    return all(S.find(x.key) is x for x in X)
+
+
+class TestCases(unittest.TestCase):
+    def test_concurrent_lock_free_find(self): self.assertEqual(lock_free_reads(), [])
+    def test_ordered_batches(self): self.assertEqual(ordered_batches(), [1, 3, 5, 9])
+    def test_open_addressing_full_table(self): self.assertTrue(open_addressing_full_table())
+    def test_bloom_insert_then_find(self): self.assertTrue(bloom_insert_then_find())
+
+
+if __name__ == '__main__':
+    res = unittest.main(verbosity = 3, exit = False)
@@ -24,7 +24,7 @@
 # Thus, if c is constant, then radix sort also runs in linear time!
 
 
-from CountingSort import countingSort1
+from Lecture5.CountingSort import countingSort1
 
 
 def radixSort(A):
@@ -35,7 +35,7 @@ def radixSort(A):
     """
     n = len(A)                                                          # O(1)
     u = 1 + max([x.key for x in A])                                     # O(n)
-    c = 1 + (u.bit_length() // n.bit_length())                          # O(1)
+    c = 1 + (u.bit_length() // max(n.bit_length() - 1, 1))             # O(1) n^c > u
 
     class Obj:                                                          # tuple declaration
         def __init__(self):
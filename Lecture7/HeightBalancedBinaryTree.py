@@ -43,7 +43,7 @@ class BinaryNode:
         self.subtree_update()
 
     def subtree_update(self):                                                   # O(1) for height augmentation
-        self.height = 1 + max(height(self.left)) + max(height(self.right))
+        self.height = 1 + max(height(self.left), height(self.right))
 
     # ------------- Rotation ---------------- #
     # As we add or remove nodes to our tree, it is possible that our tree will become imbalanced.
@@ -120,7 +120,7 @@ class BinaryNode:
                 self.right.subtree_rotate_right()
             self.subtree_rotate_left()
         elif self.skew() == -2:
-            if self.skew() > 0:
+            if self.left.skew() > 0:
                 self.left.subtree_rotate_left()
             self.subtree_rotate_right()
 
@@ -179,6 +179,7 @@ class BinaryNode:
             self.left, B.parent = B, self
         else:
             self.right, B.parent = B, self
+        self.maintain()
 
     def subtree_delete(self):                                                   # O(log n)
         if self.left or self.right:
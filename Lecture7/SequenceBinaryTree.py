@@ -9,7 +9,7 @@
 # In order to evaluate subtree size efficiently, we augment each node in the tree with the size of its subtree.
 # A node’s size can be computed in constant time given the sizes of its children by summing them and adding 1.
 
-from HeightBalancedBinaryTree import BinaryNode
+from HeightBalancedBinaryTree import BinaryNode, height
 from Lecture6.BinaryTree import BinaryTree
 
 
@@ -35,6 +35,72 @@ class SizeNode(BinaryNode):
         else:
             return self
 
+# ------------------ Join and Split ------------------ #
+# Two height-balanced trees can be joined around a middle node <K> in O(|h_L - h_R| + 1) time.
+# If the trees have similar heights, <K> simply becomes the root with the two trees as its children.
+# Otherwise, if <L> is taller, walk down the right spine of <L> to the first node <C> whose height is at most h_R + 1,
+#   replace <C> by <K> with children <C> and <R>, and rebalance from <K>'s parent back up to the root,
+#   just like after inserting a leaf. Joining onto a taller <R> is symmetric.
+# Splitting a tree at index i walks down the path to the ith node,
+#   cutting off the subtrees on each side and joining them back into a left tree and a right tree.
+# The cost of those joins telescopes along the path, so splitting also takes O(log n) time.
+# The roots passed to and returned from these functions are detached, i.e. their parent is None.
+
+def subtree_join(L, K, R):                                                  # O(log n)
+    K.left = K.right = K.parent = None
+    if height(L) > height(R) + 1:
+        P, C = None, L
+        while height(C) > height(R) + 1:
+            P, C = C, C.right
+        K.left, K.right = C, R
+        if C:
+            C.parent = K
+        if R:
+            R.parent = K
+        P.right, K.parent = K, P
+        K.subtree_update()
+        P.maintain()
+        return L
+    if height(R) > height(L) + 1:
+        P, C = None, R
+        while height(C) > height(L) + 1:
+            P, C = C, C.left
+        K.left, K.right = L, C
+        if C:
+            C.parent = K
+        if L:
+            L.parent = K
+        P.left, K.parent = K, P
+        K.subtree_update()
+        P.maintain()
+        return R
+    K.left, K.right = L, R
+    if L:
+        L.parent = K
+    if R:
+        R.parent = K
+    K.subtree_update()
+    return K
+
+
+def subtree_split(A, i):                                                    # O(log n)
+    # split the subtree rooted at <A> into the first i nodes and the rest
+    if A is None:
+        return None, None
+    L, R = A.left, A.right
+    for B in (L, R):
+        if B:
+            B.parent = None
+    A.left = A.right = None
+    A.subtree_update()
+    L_size = L.size if L else 0
+    if i <= L_size:
+        L1, L2 = subtree_split(L, i)
+        return L1, subtree_join(L2, A, R)
+    R1, R2 = subtree_split(R, i - L_size - 1)
+    return subtree_join(L, A, R1), R2
+
+
 # --------------- Sequence AVL -------------- #
 # Once we are able to find the ith node in a balanced binary tree in O(log n) time,
 # the remainder of the Sequence interface operations can be implemented directly using binary tree operations.
@@ -53,11 +119,14 @@ class SequenceBinaryTree(BinaryTree):
             if i < c:
                 root.left = build_subtree(X, i, c - 1)
                 root.left.parent = root
-            if i > c:
+            if c < j:
                 root.right = build_subtree(X, c + 1, j)
                 root.right.parent = root
             root.subtree_update()
             return root
+        if len(X) == 0:
+            self.root, self.size = None, 0
+            return
         self.root = build_subtree(X, 0, len(X) - 1)
         self.size = self.root.size
 
@@ -85,7 +154,7 @@ class SequenceBinaryTree(BinaryTree):
     def delete_at(self, i):
         assert self.root
         node = self.root.subtree_at(i)
-        ext = node.subtree_delete
+        ext = node.subtree_delete()
         if ext.parent is None:
             self.root = None
         self.size -= 1
@@ -102,3 +171,40 @@ class SequenceBinaryTree(BinaryTree):
 
     def delete_last(self):
         return self.delete_at(len(self) - 1)
+
+    # ---- Rope Operations ---- #
+    # With join and split, a Sequence AVL can cut and paste whole blocks of items in O(log n) time,
+    #   instead of inserting or deleting the k items of a block one at a time in O(k log n) time.
+    # A sequence supporting these operations is often called a rope.
+    # slice(i, j) cuts items i to j - 1 out of this sequence, and concat and insert_seq_at empty the other sequence.
+
+    def _set_root(self, A):                                                 # O(1)
+        self.root = A
+        self.size = A.size if A else 0
+
+    def split_at(self, i):                                                  # O(log n)
+        L, R = subtree_split(self.root, i)
+        self._set_root(L)
+        other = SequenceBinaryTree()
+        other._set_root(R)
+        return other
+
+    def concat(self, other):                                                # O(log n)
+        if other.root:
+            if self.root:
+                K, R = subtree_split(other.root, 1)
+                self._set_root(subtree_join(self.root, K, R))
+            else:
+                self._set_root(other.root)
+        other._set_root(None)
+
+    def slice(self, i, j):                                                  # O(log n)
+        R = self.split_at(j)
+        out = self.split_at(i)
+        self.concat(R)
+        return out
+
+    def insert_seq_at(self, i, other):                                      # O(log n)
+        R = self.split_at(i)
+        self.concat(other)
+        self.concat(R)
@@ -0,0 +1,134 @@
+# ---------------------------------- Set AVL Tree ---------------------------------- #
+
+# To implement a Set interface with a height-balanced tree, we store the items in increasing key order
+#   in the tree's traversal order (the Binary Search Tree Property, see Lecture6/SetBinaryTree.py),
+#   and find, insert, and delete by walking down the tree comparing keys.
+# Since the height-balanced node rebalances after every insertion and deletion, the height stays O(log n),
+#   so every find, insert, delete, and neighbour query takes O(log n) time.
+# We call this data structure a Set AVL.
+# Iterating in key order starts at the first node and repeatedly steps to the successor;
+#   every edge of the tree is walked at most twice, so the whole iteration takes O(n) time.
+
+from Lecture7.HeightBalancedBinaryTree import BinaryNode
+
+
+class SetAVLNode(BinaryNode):
+    def subtree_find(self, k):                                                  # O(log n)
+        if k < self.item.key:
+            if self.left:
+                return self.left.subtree_find(k)
+        elif k > self.item.key:
+            if self.right:
+                return self.right.subtree_find(k)
+        else:
+            return self
+        return None
+
+    def subtree_find_next(self, k):                                             # O(log n)
+        if self.item.key <= k:
+            if self.right:
+                return self.right.subtree_find_next(k)
+            else:
+                return None
+        elif self.left:
+            A = self.left.subtree_find_next(k)
+            if A:
+                return A
+        return self
+
+    def subtree_find_prev(self, k):                                             # O(log n)
+        if self.item.key >= k:
+            if self.left:
+                return self.left.subtree_find_prev(k)
+            else:
+                return None
+        elif self.right:
+            A = self.right.subtree_find_prev(k)
+            if A:
+                return A
+        return self
+
+    def subtree_insert(self, X):                                                # O(log n)
+        if X.item.key < self.item.key:
+            if self.left:
+                self.left.subtree_insert(X)
+            else:
+                self.subtree_insert_before(X)
+        elif X.item.key > self.item.key:
+            if self.right:
+                self.right.subtree_insert(X)
+            else:
+                self.subtree_insert_after(X)
+        else:
+            self.item = X.item
+
+
+class SetAVLTree:
+    def __init__(self, nodeType = SetAVLNode):                                  # O(1)
+        self.root = None
+        self.size = 0
+        self.nodeType = nodeType
+
+    def __len__(self):                                                          # O(1)
+        return self.size
+
+    def __iter__(self):                                                         # O(n)
+        if self.root:
+            node = self.root.subtree_first()
+            while node:
+                yield node.item
+                node = node.successor()
+
+    def iter_order(self):                                                       # O(n)
+        yield from self
+
+    def build(self, X):                                                         # O(n log n)
+        for x in X:
+            self.insert(x)
+
+    def find_min(self):                                                         # O(log n)
+        if self.root:
+            return self.root.subtree_first().item
+
+    def find_max(self):                                                         # O(log n)
+        if self.root:
+            return self.root.subtree_last().item
+
+    def find(self, k):                                                          # O(log n)
+        if self.root:
+            node = self.root.subtree_find(k)
+            if node:
+                return node.item
+
+    def find_next(self, k):                                                     # O(log n)
+        if self.root:
+            node = self.root.subtree_find_next(k)
+            if node:
+                return node.item
+
+    def find_prev(self, k):                                                     # O(log n)
+        if self.root:
+            node = self.root.subtree_find_prev(k)
+            if node:
+                return node.item
+
+    def insert(self, x):                                                        # O(log n)
+        newNode = self.nodeType(x)
+        if self.root:
+            self.root.subtree_insert(newNode)
+            if newNode.parent is None:
+                return False
+        else:
+            self.root = newNode
+        self.size += 1
+        return True
+
+    def delete(self, k):                                                        # O(log n)
+        assert self.root
+        node = self.root.subtree_find(k)
+        assert node
+        ext = node.subtree_delete()
+        if ext.parent is None:
+            self.root = None
+        self.size -= 1
+        return ext.item